@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -62,6 +63,14 @@ class VectorConfig:
         VECTOR_SYNC_PROJECTS: Comma-separated project keys or '*'
         VECTOR_SYNC_COMMENTS: Enable comment indexing (default: true)
         VECTOR_BATCH_SIZE: Batch size for embedding operations
+        VECTOR_MAX_CONCURRENT_PROJECTS: Projects synced in parallel by full sync
+        VECTOR_EMBEDDING_REQUESTS_PER_MINUTE: Per-process cap on embedding API requests
+            (default: 0, unlimited)
+        VECTOR_JIRA_PAGE_SIZE: Issues requested per Jira search during sync
+        VECTOR_SYNC_STATUS_TTL_SECONDS: How long sync status reuses store stats
+        VECTOR_CACHE_QUANTIZE: 'int8' to quantize the in-memory embedding
+            cache, or 'none' (default)
+        VECTOR_FUZZY_CACHE: Reuse cached embeddings for near-identical texts
         VECTOR_SELF_QUERY_MODEL: LLM model for self-query parsing
         MCP_MAX_RESPONSE_TOKENS: Max tokens in MCP responses
     """
@@ -100,6 +109,14 @@ class VectorConfig:
         default_factory=lambda: os.getenv("VECTOR_SYNC_COMMENTS", "true").lower()
         == "true"
     )
+    jira_page_size: int = field(
+        default_factory=lambda: int(os.getenv("VECTOR_JIRA_PAGE_SIZE", "1000"))
+    )
+    sync_status_ttl_seconds: float = field(
+        default_factory=lambda: float(
+            os.getenv("VECTOR_SYNC_STATUS_TTL_SECONDS", "5")
+        )
+    )
 
     # Performance
     batch_size: int = field(
@@ -108,10 +125,25 @@ class VectorConfig:
     max_concurrent_embeddings: int = field(
         default_factory=lambda: int(os.getenv("VECTOR_MAX_CONCURRENT_EMBEDDINGS", "5"))
     )
+    embedding_requests_per_minute: int = field(
+        default_factory=lambda: int(
+            os.getenv("VECTOR_EMBEDDING_REQUESTS_PER_MINUTE", "0")
+        )
+    )
+    max_concurrent_projects: int = field(
+        default_factory=lambda: int(os.getenv("VECTOR_MAX_CONCURRENT_PROJECTS", "4"))
+    )
     cache_embeddings: bool = field(
         default_factory=lambda: os.getenv("VECTOR_CACHE_EMBEDDINGS", "true").lower()
         == "true"
     )
+    cache_quantize: str = field(
+        default_factory=lambda: os.getenv("VECTOR_CACHE_QUANTIZE", "none").lower()
+    )
+    fuzzy_cache: bool = field(
+        default_factory=lambda: os.getenv("VECTOR_FUZZY_CACHE", "false").lower()
+        == "true"
+    )
 
     # Self-query
     self_query_model: str = field(
@@ -145,8 +177,22 @@ class VectorConfig:
 
     @classmethod
     def from_env(cls) -> VectorConfig:
-        """Create config from environment variables."""
-        return cls()
+        """Create config from environment variables.
+
+        Parsing is memoized on the values of the variables in ``_ENV_VARS``,
+        so repeated calls with an unchanged environment skip it. Each call
+        still returns its own instance that callers are free to modify.
+        """
+        if cls is not VectorConfig:
+            return cls()
+        cached = _config_for_env(tuple(os.environ.get(name) for name in _ENV_VARS))
+        return replace(cached, sync_projects=list(cached.sync_projects))
+
+    @staticmethod
+    def reload() -> None:
+        """Drop memoized configs so the next ``from_env`` re-parses."""
+        _config_for_env.cache_clear()
+        get_cached_config.cache_clear()
 
     def ensure_db_path(self) -> Path:
         """Ensure the database path exists and return it."""
@@ -154,6 +200,56 @@ class VectorConfig:
         return self.db_path
 
 
+# Every environment variable VectorConfig reads; from_env keys its cache on these
+_ENV_VARS = (
+    "VECTOR_DB_PATH",
+    "VECTOR_EMBEDDING_PROVIDER",
+    "VECTOR_EMBEDDING_MODEL",
+    "VECTOR_EMBEDDING_DIMENSIONS",
+    "VECTOR_SYNC_ENABLED",
+    "VECTOR_SYNC_INTERVAL_MINUTES",
+    "VECTOR_SYNC_PROJECTS",
+    "VECTOR_SYNC_COMMENTS",
+    "VECTOR_JIRA_PAGE_SIZE",
+    "VECTOR_SYNC_STATUS_TTL_SECONDS",
+    "VECTOR_BATCH_SIZE",
+    "VECTOR_MAX_CONCURRENT_EMBEDDINGS",
+    "VECTOR_EMBEDDING_REQUESTS_PER_MINUTE",
+    "VECTOR_MAX_CONCURRENT_PROJECTS",
+    "VECTOR_CACHE_EMBEDDINGS",
+    "VECTOR_CACHE_QUANTIZE",
+    "VECTOR_FUZZY_CACHE",
+    "VECTOR_SELF_QUERY_MODEL",
+    "MCP_MAX_RESPONSE_TOKENS",
+    "MCP_COMPACT_RESPONSES",
+    "VECTOR_FTS_WEIGHT",
+    "VECTOR_DEFAULT_MIN_SCORE",
+    "VECTOR_DUPLICATE_THRESHOLD",
+    "VECTOR_SIMILAR_THRESHOLD",
+)
+
+
+@lru_cache(maxsize=8)
+def _config_for_env(env_values: tuple[str | None, ...]) -> VectorConfig:
+    """Parse a config for one snapshot of ``_ENV_VARS`` values.
+
+    ``env_values`` is only the cache key; the fields read the live
+    environment, which matches it at call time.
+    """
+    return VectorConfig()
+
+
+@lru_cache(maxsize=1)
+def get_cached_config() -> VectorConfig:
+    """Get a process-wide config built from the environment once.
+
+    For long-running servers whose environment doesn't change after startup.
+    The instance is shared, so callers must not mutate it; use
+    ``VectorConfig.from_env()`` when a private copy is needed.
+    """
+    return VectorConfig.from_env()
+
+
 def _parse_projects(value: str) -> list[str]:
     """Parse comma-separated project keys or '*' for all."""
     if value.strip() == "*":
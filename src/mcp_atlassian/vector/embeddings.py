@@ -8,10 +8,12 @@ import json
 import logging
 import sqlite3
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import numpy as np
 from openai import AsyncOpenAI, RateLimitError
 from tenacity import (
     retry,
@@ -21,12 +23,16 @@ from tenacity import (
 )
 
 from mcp_atlassian.vector.config import EmbeddingProvider, VectorConfig
+from mcp_atlassian.vector.rate_limit import RateLimiter, get_rate_limiter
+from mcp_atlassian.vector.simhash import SimHashIndex
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Default local embedding model
 DEFAULT_LOCAL_MODEL = "nomic-ai/nomic-embed-text-v1.5"
 
@@ -35,15 +41,126 @@ _local_model: Any = None
 _local_model_name: str | None = None
 
 
-def chunked(iterable: list, size: int) -> list[list]:
-    """Split a list into chunks of specified size."""
-    return [iterable[i : i + size] for i in range(0, len(iterable), size)]
+def chunked(iterable: Iterable[T], size: int) -> list[list[T]]:
+    """Split items into chunks of specified size.
+
+    Lists are sliced directly, which beats islice in CPython; any other
+    iterable is consumed once without being copied into a list first.
+    """
+    if isinstance(iterable, list):
+        return [iterable[i : i + size] for i in range(0, len(iterable), size)]
+    it = iter(iterable)
+    chunks = []
+    while chunk := list(islice(it, size)):
+        chunks.append(chunk)
+    return chunks
+
+
+class EmbeddingMatrix:
+    """In-memory embedding cache backed by one contiguous matrix.
+
+    Keys map to row indices; rows share a single array that doubles in
+    capacity as it fills. A 1536-dim vector costs 6 KB here as float32
+    instead of ~43 KB as a list of Python floats, and the populated rows can
+    be used directly in vectorized similarity math via ``vectors``.
+
+    With ``quantize`` set, rows are stored as int8 with a float32 scale per
+    row (symmetric, max-abs), another 4x smaller at a small precision cost.
+    """
+
+    def __init__(self, initial_capacity: int = 64, quantize: bool = False) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            initial_capacity: Rows allocated on first insert
+            quantize: Store rows as int8 with per-row scales
+        """
+        self._initial_capacity = initial_capacity
+        self._quantize = quantize
+        self._dtype = np.int8 if quantize else np.float32
+        self._index: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __getitem__(self, key: str) -> list[float]:
+        idx = self._index[key]
+        if self._quantize:
+            return (self._matrix[idx].astype(np.float32) * self._scales[idx]).tolist()
+        return self._matrix[idx].tolist()
+
+    def __setitem__(self, key: str, embedding: list[float] | np.ndarray) -> None:
+        row = np.asarray(embedding, dtype=np.float32)
+        if self._matrix is not None and row.shape[0] != self._matrix.shape[1]:
+            # Embedding model changed; older rows aren't comparable
+            self.clear()
+        if self._matrix is None:
+            self._allocate(self._initial_capacity, row.shape[0])
+
+        idx = self._index.get(key)
+        if idx is None:
+            idx = len(self._index)
+            if idx == self._matrix.shape[0]:
+                self._grow()
+            self._index[key] = idx
+
+        if self._quantize:
+            scale = float(np.abs(row).max()) / 127 if row.size else 0.0
+            scale = scale or 1.0
+            self._matrix[idx] = np.round(row / scale).astype(np.int8)
+            self._scales[idx] = scale
+        else:
+            self._matrix[idx] = row
+
+    def _allocate(self, rows: int, dims: int) -> None:
+        self._matrix = np.empty((rows, dims), dtype=self._dtype)
+        if self._quantize:
+            self._scales = np.empty(rows, dtype=np.float32)
+
+    def _grow(self) -> None:
+        old_matrix, old_scales = self._matrix, self._scales
+        used = old_matrix.shape[0]
+        self._allocate(used * 2, old_matrix.shape[1])
+        self._matrix[:used] = old_matrix
+        if self._quantize:
+            self._scales[:used] = old_scales
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Populated rows as float32, in insertion order."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        used = len(self._index)
+        if self._quantize:
+            return self._matrix[:used].astype(np.float32) * self._scales[:used, None]
+        return self._matrix[:used]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for rows and scales, including spare capacity."""
+        if self._matrix is None:
+            return 0
+        scales = self._scales.nbytes if self._scales is not None else 0
+        return self._matrix.nbytes + scales
+
+    def clear(self) -> None:
+        """Drop all rows and release the matrix."""
+        self._index.clear()
+        self._matrix = None
+        self._scales = None
 
 
 class PersistentEmbeddingCache:
     """SQLite-backed persistent cache for embeddings.
 
     Survives restarts and implements LRU eviction to prevent unbounded growth.
+    Vectors are stored as raw float32 blobs; rows written by older versions
+    as JSON text are still readable.
     """
 
     def __init__(self, cache_path: Path, max_entries: int = 100_000) -> None:
@@ -62,6 +179,10 @@ class PersistentEmbeddingCache:
         """Initialize the SQLite database schema."""
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
         conn = self._get_conn()
+        # WAL lets readers proceed during sync writes; NORMAL is durable enough
+        # for a cache whose entries can always be recomputed
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS embeddings (
                 content_hash TEXT PRIMARY KEY,
@@ -87,7 +208,7 @@ class PersistentEmbeddingCache:
         """Get embedding from cache.
 
         Args:
-            content_hash: MD5 hash of content
+            content_hash: Cache key of the embedded text
 
         Returns:
             Embedding vector or None if not found
@@ -105,23 +226,43 @@ class PersistentEmbeddingCache:
                 (time.time(), content_hash)
             )
             conn.commit()
-            return json.loads(row["embedding"])
+            return self._decode(row["embedding"])
         return None
 
+    @staticmethod
+    def _encode(embedding: list[float]) -> bytes:
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def _decode(value: bytes | str) -> list[float]:
+        if isinstance(value, str):
+            return json.loads(value)
+        return np.frombuffer(value, dtype=np.float32).tolist()
+
     def set(self, content_hash: str, embedding: list[float]) -> None:
         """Store embedding in cache.
 
         Args:
-            content_hash: MD5 hash of content
+            content_hash: Cache key of the embedded text
             embedding: Embedding vector to store
         """
+        self.set_many([(content_hash, embedding)])
+
+    def set_many(self, items: list[tuple[str, list[float]]]) -> None:
+        """Store several embeddings in one transaction.
+
+        Args:
+            items: (cache key, embedding) pairs to store
+        """
+        if not items:
+            return
         conn = self._get_conn()
         now = time.time()
-        conn.execute("""
+        conn.executemany("""
             INSERT OR REPLACE INTO embeddings
             (content_hash, embedding, created_at, last_accessed)
             VALUES (?, ?, ?, ?)
-        """, (content_hash, json.dumps(embedding), now, now))
+        """, [(key, self._encode(embedding), now, now) for key, embedding in items])
         conn.commit()
 
         # Evict old entries if over limit
@@ -190,17 +331,35 @@ class EmbeddingPipeline:
     Includes rate limiting, batching, retry logic, and persistent caching.
     """
 
-    def __init__(self, config: VectorConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: VectorConfig | None = None,
+        client: AsyncOpenAI | None = None,
+    ) -> None:
         """Initialize the embedding pipeline.
 
         Args:
             config: Vector configuration. Uses defaults from env if not provided.
+            client: OpenAI client to share with the caller. Created lazily if
+                not provided.
         """
         self.config = config or VectorConfig.from_env()
-        self._client: AsyncOpenAI | None = None
+        self._client: AsyncOpenAI | None = client
         self._persistent_cache: PersistentEmbeddingCache | None = None
-        self._memory_cache: dict[str, list[float]] = {}  # Hot cache for current session
+        self._memory_cache = EmbeddingMatrix(  # Hot cache for current session
+            quantize=self.config.cache_quantize == "int8"
+        )
+        # Near-duplicate lookup over memory-cached texts, if enabled
+        self._fuzzy_index: SimHashIndex | None = (
+            SimHashIndex() if self.config.fuzzy_cache else None
+        )
         self._semaphore: asyncio.Semaphore | None = None
+        self._rate_limiter: RateLimiter | None = None
+        self._key_hasher = hashlib.blake2b(
+            f"{self.config.embedding_provider.value}|{self.config.embedding_model}|"
+            f"{self.config.embedding_dimensions}|".encode(),
+            digest_size=16,
+        )
 
     @property
     def cache(self) -> PersistentEmbeddingCache:
@@ -227,15 +386,35 @@ class EmbeddingPipeline:
             self._semaphore = asyncio.Semaphore(self.config.max_concurrent_embeddings)
         return self._semaphore
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the process-wide request pacer, if a per-minute limit is set."""
+        if (
+            self._rate_limiter is None
+            and self.config.embedding_requests_per_minute > 0
+        ):
+            self._rate_limiter = get_rate_limiter(
+                self.config.embedding_requests_per_minute
+            )
+        return self._rate_limiter
+
     def _get_cache_key(self, text: str) -> str:
-        """Generate cache key for text content."""
-        return hashlib.md5(text.encode()).hexdigest()
+        """Generate cache key for text content.
+
+        BLAKE2b with a 16-byte digest: faster than MD5 on 64-bit CPUs and
+        still a 32-character hex key. The hash is seeded with the provider,
+        model and dimensions, so vectors from different models never share
+        a key and can coexist in the persistent cache during a migration.
+        """
+        hasher = self._key_hasher.copy()
+        hasher.update(text.encode())
+        return hasher.hexdigest()
 
     def _get_cached(self, cache_key: str) -> list[float] | None:
         """Get embedding from cache (memory first, then persistent).
 
         Args:
-            cache_key: MD5 hash of content
+            cache_key: Content hash from _get_cache_key
 
         Returns:
             Cached embedding or None
@@ -258,13 +437,45 @@ class EmbeddingPipeline:
         """Store embedding in both memory and persistent cache.
 
         Args:
-            cache_key: MD5 hash of content
+            cache_key: Content hash from _get_cache_key
             embedding: Embedding vector to store
         """
         self._memory_cache[cache_key] = embedding
         if self.config.cache_embeddings:
             self.cache.set(cache_key, embedding)
 
+    def _get_fuzzy(self, text: str) -> list[float] | None:
+        """Get the embedding of a memory-cached, nearly identical text.
+
+        Args:
+            text: Text that missed the exact cache
+
+        Returns:
+            Reused embedding or None
+        """
+        if self._fuzzy_index is None:
+            return None
+        key = self._fuzzy_index.find(text)
+        if key is None or key not in self._memory_cache:
+            return None
+        return self._memory_cache[key]
+
+    def _index_text(self, cache_key: str, text: str) -> None:
+        """Make a cached text available to fuzzy lookups."""
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.add(cache_key, text)
+
+    def _set_cached_many(self, items: list[tuple[str, list[float]]]) -> None:
+        """Store several embeddings, writing the persistent cache once.
+
+        Args:
+            items: (cache key, embedding) pairs to store
+        """
+        for cache_key, embedding in items:
+            self._memory_cache[cache_key] = embedding
+        if self.config.cache_embeddings:
+            self.cache.set_many(items)
+
     async def embed(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
@@ -280,8 +491,14 @@ class EmbeddingPipeline:
         cached = self._get_cached(cache_key)
         if cached is not None:
             logger.debug("Cache hit for embedding")
+            self._index_text(cache_key, text)
             return cached
 
+        fuzzy = self._get_fuzzy(text)
+        if fuzzy is not None:
+            logger.debug("Fuzzy cache hit for embedding")
+            return fuzzy
+
         # Generate embedding
         if self.config.embedding_provider == EmbeddingProvider.OPENAI:
             embedding = await self._embed_openai([text])
@@ -291,6 +508,7 @@ class EmbeddingPipeline:
 
         # Cache result
         self._set_cached(cache_key, result)
+        self._index_text(cache_key, text)
 
         return result
 
@@ -311,16 +529,27 @@ class EmbeddingPipeline:
         results: list[list[float] | None] = [None] * len(texts)
         uncached_texts: list[str] = []
         uncached_indices: list[int] = []
-        cache_keys: list[str] = []
+        # Repeated uncached texts (templates, empty descriptions) are embedded
+        # once; later copies take the first occurrence's vector
+        first_uncached: dict[str, int] = {}
+        duplicates: list[tuple[int, int]] = []
+
+        # Hash every text once; the keys are reused when caching new embeddings
+        get_key = self._get_cache_key
+        cache_keys = [get_key(text) for text in texts]
 
         # Check cache for each text
-        for i, text in enumerate(texts):
-            cache_key = self._get_cache_key(text)
-            cache_keys.append(cache_key)
+        for i, (text, cache_key) in enumerate(zip(texts, cache_keys, strict=True)):
             cached = self._get_cached(cache_key)
             if cached is not None:
                 results[i] = cached
+                self._index_text(cache_key, text)
+            elif (fuzzy := self._get_fuzzy(text)) is not None:
+                results[i] = fuzzy
+            elif cache_key in first_uncached:
+                duplicates.append((i, first_uncached[cache_key]))
             else:
+                first_uncached[cache_key] = i
                 uncached_texts.append(text)
                 uncached_indices.append(i)
 
@@ -330,38 +559,57 @@ class EmbeddingPipeline:
                 f"embedding {len(uncached_texts)} texts"
             )
 
+        async def embed_sub_batch(
+            batch_texts: list[str], batch_indices: list[int]
+        ) -> None:
+            try:
+                if self.config.embedding_provider == EmbeddingProvider.OPENAI:
+                    batch_embeddings = await self._embed_openai(batch_texts)
+                else:
+                    # Use batch local embedding for efficiency
+                    loop = asyncio.get_event_loop()
+                    batch_embeddings = await loop.run_in_executor(
+                        None, self._embed_local_batch_sync, batch_texts
+                    )
+
+                # Store results and cache
+                new_entries = []
+                for idx, text, embedding in zip(
+                    batch_indices, batch_texts, batch_embeddings, strict=False
+                ):
+                    results[idx] = embedding
+                    new_entries.append((cache_keys[idx], embedding))
+                    self._index_text(cache_keys[idx], text)
+                self._set_cached_many(new_entries)
+
+            except Exception as e:
+                # Log error but continue with other batches
+                logger.error(f"Batch embedding failed: {e}")
+                # Mark failed items as None, they'll be filtered out
+                for idx in batch_indices:
+                    if results[idx] is None:
+                        logger.warning(f"Failed to embed text at index {idx}")
+
         # Embed uncached texts in batches
         if uncached_texts:
-            for batch_texts, batch_indices in zip(
-                chunked(uncached_texts, self.config.batch_size),
-                chunked(uncached_indices, self.config.batch_size),
-                strict=False,
-            ):
-                try:
-                    if self.config.embedding_provider == EmbeddingProvider.OPENAI:
-                        batch_embeddings = await self._embed_openai(batch_texts)
-                    else:
-                        # Use batch local embedding for efficiency
-                        loop = asyncio.get_event_loop()
-                        batch_embeddings = await loop.run_in_executor(
-                            None, self._embed_local_batch_sync, batch_texts
-                        )
-
-                    # Store results and cache
-                    for idx, text, embedding in zip(
-                        batch_indices, batch_texts, batch_embeddings, strict=False
-                    ):
-                        results[idx] = embedding
-                        cache_key = self._get_cache_key(text)
-                        self._set_cached(cache_key, embedding)
-
-                except Exception as e:
-                    # Log error but continue with other batches
-                    logger.error(f"Batch embedding failed: {e}")
-                    # Mark failed items as None, they'll be filtered out
-                    for idx in batch_indices:
-                        if results[idx] is None:
-                            logger.warning(f"Failed to embed text at index {idx}")
+            sub_batches = [
+                embed_sub_batch(batch_texts, batch_indices)
+                for batch_texts, batch_indices in zip(
+                    chunked(uncached_texts, self.config.batch_size),
+                    chunked(uncached_indices, self.config.batch_size),
+                    strict=False,
+                )
+            ]
+            if self.config.embedding_provider == EmbeddingProvider.OPENAI:
+                # Requests overlap; _embed_openai caps them with the semaphore
+                await asyncio.gather(*sub_batches)
+            else:
+                # A single local model gains nothing from overlapping batches
+                for sub_batch in sub_batches:
+                    await sub_batch
+
+        for idx, source_idx in duplicates:
+            results[idx] = results[source_idx]
 
         # Return only successful embeddings
         return [r for r in results if r is not None]
@@ -419,6 +667,9 @@ class EmbeddingPipeline:
             List of embedding vectors
         """
         async with self.semaphore:
+            # Every attempt, retries included, counts against the budget
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
             try:
                 response = await self.client.embeddings.create(
                     model=self.config.embedding_model,
@@ -485,7 +736,12 @@ class EmbeddingPipeline:
         if "nomic" in self.config.embedding_model.lower():
             texts = [f"search_document: {t}" for t in texts]
 
-        embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+        embeddings = model.encode(
+            texts,
+            batch_size=self.config.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
         return [emb.tolist() for emb in embeddings]
 
     def _get_local_model(self) -> Any:
@@ -526,6 +782,10 @@ class EmbeddingPipeline:
             cache_folder=str(cache_dir),
             trust_remote_code=trust_remote_code,
         )
+        if _local_model.device.type == "cuda":
+            # Half precision doubles GPU throughput with no meaningful
+            # change in retrieval quality
+            _local_model.half()
         _local_model_name = model_name
 
         logger.info(f"Loaded model with dimension: {_local_model.get_sentence_embedding_dimension()}")
@@ -534,6 +794,8 @@ class EmbeddingPipeline:
     def clear_cache(self) -> None:
         """Clear both memory and persistent embedding caches."""
         self._memory_cache.clear()
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.clear()
         if self._persistent_cache:
             self._persistent_cache.clear()
         logger.info("Embedding caches cleared")
@@ -546,10 +808,7 @@ class EmbeddingPipeline:
         """
         stats = {
             "memory_cache_entries": len(self._memory_cache),
-            "memory_cache_mb": round(
-                len(self._memory_cache) * self.config.embedding_dimensions * 4 / (1024 * 1024),
-                2
-            ),
+            "memory_cache_mb": round(self._memory_cache.nbytes / (1024 * 1024), 2),
         }
 
         # Add persistent cache stats if initialized
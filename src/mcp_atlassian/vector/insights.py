@@ -352,7 +352,10 @@ class InsightsEngine:
             if len(bugs_df) < 2:
                 return []
 
-            vectors = np.array(bugs_df["vector"].tolist())
+            vectors = np.array(bugs_df["vector"].tolist(), dtype=np.float32)
+            # |a - b|^2 = |a|^2 + |b|^2 - 2a.b, so each row's distances are one
+            # matrix-vector product instead of an N x dim difference array
+            sq_norms = np.einsum("ij,ij->i", vectors, vectors)
 
             # Find similar pairs
             patterns: list[dict[str, Any]] = []
@@ -363,7 +366,8 @@ class InsightsEngine:
                     continue
 
                 # Find similar bugs
-                similarities = 1 - np.linalg.norm(vectors - vectors[i], axis=1) / 2
+                sq_dists = sq_norms + sq_norms[i] - 2 * (vectors @ vectors[i])
+                similarities = 1 - np.sqrt(np.maximum(sq_dists, 0)) / 2
                 similar_mask = similarities >= min_similarity
                 similar_indices = np.where(similar_mask)[0]
 
@@ -0,0 +1,63 @@
+"""Request pacing for embedding provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+# Limiters by budget, shared by every pipeline in the process
+_limiters: dict[int, RateLimiter] = {}
+
+
+class RateLimiter:
+    """Async token bucket that paces requests to a per-minute budget.
+
+    The bucket holds up to one second's worth of requests (at least one), so
+    short bursts go through immediately and sustained load is spread evenly
+    instead of tripping the provider's limit and backing off. Waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            requests_per_minute: Sustained request budget; must be positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.rate = requests_per_minute / 60
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume its token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def get_rate_limiter(requests_per_minute: int) -> RateLimiter:
+    """Get the process-wide limiter for a per-minute budget.
+
+    The provider enforces its limit per API key, not per pipeline, so every
+    pipeline configured with the same budget (the web server's and each
+    scheduled sync's) draws from one bucket.
+
+    Args:
+        requests_per_minute: Sustained request budget; must be positive
+    """
+    limiter = _limiters.get(requests_per_minute)
+    if limiter is None:
+        limiter = _limiters[requests_per_minute] = RateLimiter(requests_per_minute)
+    return limiter
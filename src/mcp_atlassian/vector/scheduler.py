@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import signal
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -29,6 +30,7 @@ class SyncScheduler:
         jira_facade: JiraFacade,
         config: VectorConfig | None = None,
         interval_minutes: int | None = None,
+        on_sync: Callable[[SyncResult], None] | None = None,
     ) -> None:
         """Initialize the scheduler.
 
@@ -36,6 +38,8 @@ class SyncScheduler:
             jira_facade: Jira client facade for API access.
             config: Vector configuration.
             interval_minutes: Sync interval in minutes. Defaults to config value.
+            on_sync: Called with each completed sync's result, e.g. to drop
+                caches derived from the index.
         """
         self.jira = jira_facade
         self.config = config or VectorConfig.from_env()
@@ -46,6 +50,7 @@ class SyncScheduler:
         self._last_result: SyncResult | None = None
         self._sync_count = 0
         self._error_count = 0
+        self._on_sync = on_sync
 
     @staticmethod
     def _refresh_server_singletons() -> None:
@@ -129,6 +134,8 @@ class SyncScheduler:
                 self._last_result = result
                 self._sync_count += 1
                 self._refresh_server_singletons()
+                if self._on_sync:
+                    self._on_sync(result)
 
                 if result.errors:
                     self._error_count += len(result.errors)
@@ -163,6 +170,8 @@ class SyncScheduler:
         self._last_result = result
         self._sync_count += 1
         self._refresh_server_singletons()
+        if self._on_sync:
+            self._on_sync(result)
 
         if result.errors:
             self._error_count += len(result.errors)
@@ -104,10 +104,12 @@ def _months_ago(m: re.Match) -> datetime:
 
 
 def _this_week(m: re.Match) -> datetime:
-    return _now() - timedelta(days=_now().weekday())
+    now = _now()
+    return now - timedelta(days=now.weekday())
 
 
-# Date expression patterns
+# Date expression patterns. These are matched against the already-lowercased
+# expression and compiled without re.IGNORECASE, so keep them lowercase.
 DATE_PATTERNS: dict[str, Any] = {
     r"last\s+(\d+)\s+days?": _days_ago,
     r"last\s+(\d+)\s+weeks?": _weeks_ago,
@@ -124,6 +126,11 @@ DATE_PATTERNS: dict[str, Any] = {
     r"q4\s*(\d{4})?": lambda m: _quarter_start(4, m.group(1)),
 }
 
+# Compiled once at import; order is preserved so the first listed pattern wins
+_COMPILED_DATE_PATTERNS: tuple[tuple[re.Pattern[str], Any], ...] = tuple(
+    (re.compile(pattern), handler) for pattern, handler in DATE_PATTERNS.items()
+)
+
 
 def _quarter_start(quarter: int, year_str: str | None) -> datetime:
     """Get the start date of a quarter."""
@@ -135,8 +142,8 @@ def _quarter_start(quarter: int, year_str: str | None) -> datetime:
 def parse_date_expression(expr: str) -> datetime | None:
     """Parse natural language date expressions."""
     expr_lower = expr.lower().strip()
-    for pattern, handler in DATE_PATTERNS.items():
-        match = re.search(pattern, expr_lower)
+    for pattern, handler in _COMPILED_DATE_PATTERNS:
+        match = pattern.search(expr_lower)
         if match:
             return handler(match)
     return None
@@ -305,7 +312,7 @@ class SelfQueryParser:
         global _query_cache
         if cache_key in _query_cache:
             parsed, timestamp = _query_cache[cache_key]
-            if time.time() - timestamp < _CACHE_TTL_SECONDS:
+            if time.monotonic() - timestamp < _CACHE_TTL_SECONDS:
                 logger.debug(f"Query cache hit for key {cache_key[:8]}")
                 return parsed
             else:
@@ -326,7 +333,7 @@ class SelfQueryParser:
             for key in sorted_keys[: _CACHE_MAX_SIZE // 10]:
                 del _query_cache[key]
 
-        _query_cache[cache_key] = (parsed, time.time())
+        _query_cache[cache_key] = (parsed, time.monotonic())
 
     async def parse(self, query: str) -> ParsedQuery:
         """Parse a natural language query into structured filters.
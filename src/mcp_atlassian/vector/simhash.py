@@ -0,0 +1,127 @@
+"""SimHash index for reusing embeddings of near-duplicate texts."""
+
+from __future__ import annotations
+
+import hashlib
+from difflib import SequenceMatcher
+
+import numpy as np
+
+# 64-bit fingerprints split into four 16-bit bands. Two fingerprints within
+# Hamming distance 3 must agree on at least one band, so probing each band's
+# bucket finds every candidate without scanning the whole index.
+_BANDS = 4
+_BAND_BITS = 16
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """Compute a 64-bit SimHash fingerprint over word shingles.
+
+    Args:
+        text: Text to fingerprint
+        shingle_size: Number of consecutive words per shingle
+
+    Returns:
+        Fingerprint as an unsigned 64-bit integer
+    """
+    words = text.lower().split()
+    if not words:
+        return 0
+    if len(words) <= shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [
+            " ".join(words[i : i + shingle_size])
+            for i in range(len(words) - shingle_size + 1)
+        ]
+
+    digests = b"".join(
+        hashlib.blake2b(s.encode(), digest_size=8).digest() for s in shingles
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1)
+    # Each bit position votes; the fingerprint bit is set where most shingles agree
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(votes).tobytes(), "big")
+
+
+class SimHashIndex:
+    """Maps texts to cache keys and finds keys for near-identical texts.
+
+    A match needs both a fingerprint within ``max_distance`` bits and a
+    character-level similarity ratio of at least ``min_ratio``, so only
+    small edits (typo fixes, whitespace) reuse an existing entry.
+    """
+
+    def __init__(self, max_distance: int = 3, min_ratio: float = 0.95) -> None:
+        """Initialize an empty index.
+
+        Args:
+            max_distance: Maximum Hamming distance between fingerprints
+            min_ratio: Minimum difflib similarity ratio between texts
+        """
+        self.max_distance = max_distance
+        self.min_ratio = min_ratio
+        self._entries: dict[str, tuple[int, str]] = {}
+        self._buckets: list[dict[int, list[str]]] = [{} for _ in range(_BANDS)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _bands(fingerprint: int) -> list[int]:
+        return [
+            (fingerprint >> (band * _BAND_BITS)) & _BAND_MASK for band in range(_BANDS)
+        ]
+
+    def add(self, key: str, text: str) -> None:
+        """Index a text under its cache key.
+
+        Args:
+            key: Cache key the text's embedding is stored under
+            text: The embedded text
+        """
+        if key in self._entries:
+            return
+        fingerprint = simhash(text)
+        self._entries[key] = (fingerprint, text)
+        for bucket, value in zip(self._buckets, self._bands(fingerprint), strict=True):
+            bucket.setdefault(value, []).append(key)
+
+    def find(self, text: str) -> str | None:
+        """Find the key of an indexed text that is nearly identical.
+
+        Args:
+            text: Text to match
+
+        Returns:
+            Cache key of the closest acceptable match, or None
+        """
+        if not self._entries:
+            return None
+        fingerprint = simhash(text)
+        candidates: set[str] = set()
+        for bucket, value in zip(self._buckets, self._bands(fingerprint), strict=True):
+            candidates.update(bucket.get(value, ()))
+
+        best_key, best_ratio = None, self.min_ratio
+        for key in candidates:
+            other_fingerprint, other_text = self._entries[key]
+            if (fingerprint ^ other_fingerprint).bit_count() > self.max_distance:
+                continue
+            matcher = SequenceMatcher(None, text, other_text)
+            # Cheap upper bounds first; ratio() is quadratic in the worst case
+            if matcher.real_quick_ratio() < best_ratio:
+                continue
+            if matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best_key, best_ratio = key, ratio
+        return best_key
+
+    def clear(self) -> None:
+        """Drop all indexed texts."""
+        self._entries.clear()
+        for bucket in self._buckets:
+            bucket.clear()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 import lancedb
@@ -337,6 +339,31 @@ class LanceDBStore:
             logger.warning(f"Error getting issue {issue_key}: {e}")
             return None
 
+    def get_content_hashes(self, issue_ids: list[str]) -> dict[str, str]:
+        """Get the stored content hashes for a set of issues.
+
+        Args:
+            issue_ids: Issue IDs to look up
+
+        Returns:
+            Mapping of issue ID to content hash for the issues that are indexed
+        """
+        if not issue_ids:
+            return {}
+
+        try:
+            result = (
+                self.issues_table.search()
+                .where(f"issue_id IN {_format_sql_in_clause(issue_ids)}", prefilter=True)
+                .select(["issue_id", "content_hash"])
+                .limit(len(issue_ids))
+                .to_list()
+            )
+            return {r["issue_id"]: r["content_hash"] for r in result}
+        except Exception as e:
+            logger.warning(f"Error getting content hashes: {e}")
+            return {}
+
     def get_all_issue_ids(self, project_key: str | None = None) -> set[str]:
         """Get all indexed issue IDs, optionally filtered by project.
 
@@ -422,6 +449,7 @@ class LanceDBStore:
         offset: int = 0,
         filters: dict[str, Any] | None = None,
         min_score: float = 0.0,
+        columns: list[str] | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
         """Search issues by vector similarity with pagination.
 
@@ -431,6 +459,8 @@ class LanceDBStore:
             offset: Number of results to skip (for pagination)
             filters: Optional metadata filters
             min_score: Minimum similarity score (0.0-1.0) to include in results
+            columns: Columns to return; defaults to all, including the vector.
+                ``issue_id`` is always included for deduplication.
 
         Returns:
             Tuple of (results list, total matching count)
@@ -439,6 +469,11 @@ class LanceDBStore:
         fetch_limit = max((limit + offset) * 5, 100) if min_score > 0 else (limit + offset) * 3
         search = self.issues_table.search(query_vector).limit(fetch_limit)
         search = search.distance_type("cosine")  # Explicit cosine similarity
+        if columns is not None:
+            # Vector queries append _distance themselves; selecting the virtual
+            # column is rejected by some LanceDB versions
+            extra = [c for c in columns if c not in ("issue_id", "_distance")]
+            search = search.select(["issue_id", *extra])
 
         # Apply filters
         if filters:
@@ -771,23 +806,8 @@ class LanceDBStore:
             # Use efficient filtered query instead of loading all data
             project_filter = f"project_key = '{project_key}'"
 
-            # Get total count efficiently
-            try:
-                count_results = (
-                    self.issues_table.search()
-                    .where(project_filter, prefilter=True)
-                    .select(["issue_id"])
-                    .limit(100000)
-                    .to_list()
-                )
-                total_count = len(count_results)
-            except Exception:
-                total_count = 0
-
-            if total_count == 0:
-                return {"project_key": project_key, "total_issues": 0}
-
-            # Fetch only necessary columns for aggregation (much more efficient)
+            # Fetch only necessary columns for aggregation in a single scan;
+            # the row count falls out of the same result set
             agg_results = (
                 self.issues_table.search()
                 .where(project_filter, prefilter=True)
@@ -798,6 +818,10 @@ class LanceDBStore:
                 .limit(100000)
                 .to_list()
             )
+            total_count = len(agg_results)
+
+            if total_count == 0:
+                return {"project_key": project_key, "total_issues": 0}
 
             # Aggregate in-memory (but with minimal data loaded)
             type_counts: dict[str, int] = {}
@@ -838,15 +862,15 @@ class LanceDBStore:
                     for comp in components:
                         component_counts[comp] = component_counts.get(comp, 0) + 1
 
-            # Get top 10 for each category
+            # Get top 10 for each category without sorting the full histograms
             top_assignees = dict(
-                sorted(assignee_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                heapq.nlargest(10, assignee_counts.items(), key=itemgetter(1))
             )
             top_labels = dict(
-                sorted(label_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                heapq.nlargest(10, label_counts.items(), key=itemgetter(1))
             )
             top_components = dict(
-                sorted(component_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                heapq.nlargest(10, component_counts.items(), key=itemgetter(1))
             )
 
             return {
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
+from cachetools import TTLCache
+
 from mcp_atlassian.vector.config import VectorConfig
 from mcp_atlassian.vector.embeddings import EmbeddingPipeline
 from mcp_atlassian.vector.schemas import (
@@ -29,6 +34,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Jira's fixed status category keys; category names are localized and can be
+# renamed, so they are not reliable
+_STATUS_CATEGORY_BY_KEY = {
+    "new": "To Do",
+    "indeterminate": "In Progress",
+    "done": "Done",
+}
+
 
 @dataclass
 class SyncState:
@@ -64,7 +77,7 @@ class SyncState:
             return cls()
 
         try:
-            data = json.loads(path.read_text())
+            data = orjson.loads(path.read_bytes())
             # Convert datetime strings back to datetime objects
             if "last_sync_at" in data:
                 data["last_sync_at"] = datetime.fromisoformat(data["last_sync_at"])
@@ -80,22 +93,18 @@ class SyncState:
     def save(self, path: Path) -> None:
         """Save sync state to file.
 
+        The state is written to a temporary file and renamed into place, so
+        a crash mid-write leaves the previous state intact.
+
         Args:
             path: Path to state file
         """
-        data = {
-            "last_sync_at": self.last_sync_at.isoformat(),
-            "last_issue_updated": self.last_issue_updated.isoformat(),
-            "projects_synced": self.projects_synced,
-            "total_issues_indexed": self.total_issues_indexed,
-            "total_comments_indexed": self.total_comments_indexed,
-            "embedding_model": self.embedding_model,
-            "embedding_version": self.embedding_version,
-            "checkpoint_project": self.checkpoint_project,
-            "checkpoint_offset": self.checkpoint_offset,
-        }
+        # orjson serializes the dataclass and its datetimes (as ISO 8601) directly
+        data = orjson.dumps(self, option=orjson.OPT_INDENT_2)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2))
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
 
 
 @dataclass
@@ -135,6 +144,11 @@ class VectorSyncEngine:
         self.store = LanceDBStore(config=self.config)
         self.embedder = EmbeddingPipeline(config=self.config)
         self._state_path = self.config.db_path / "sync_state.json"
+        # Store stats scan whole tables; status endpoints are polled, so reuse
+        # a recent snapshot. Saving sync state clears it.
+        self._stats_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=1, ttl=self.config.sync_status_ttl_seconds
+        )
 
     def _load_state(self) -> SyncState:
         """Load sync state from disk."""
@@ -143,6 +157,7 @@ class VectorSyncEngine:
     def _save_state(self, state: SyncState) -> None:
         """Save sync state to disk."""
         state.save(self._state_path)
+        self._stats_cache.clear()
 
     async def full_sync(
         self,
@@ -157,7 +172,7 @@ class VectorSyncEngine:
         Returns:
             SyncResult with statistics
         """
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         result = SyncResult()
         state = self._load_state()
 
@@ -172,31 +187,45 @@ class VectorSyncEngine:
 
         logger.info(f"Starting full sync for projects: {projects_to_sync}")
 
-        for project_key in projects_to_sync:
-            try:
-                project_result = await self._sync_project(
+        # Projects are independent; overlap their Jira fetches, bounded so a
+        # large instance doesn't open one connection per project
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_projects)
+
+        async def sync_one(project_key: str) -> SyncResult:
+            async with semaphore:
+                return await self._sync_project(
                     project_key, incremental=False, state=state
                 )
-                result.issues_processed += project_result.issues_processed
-                result.issues_embedded += project_result.issues_embedded
-                result.issues_skipped += project_result.issues_skipped
-                result.errors.extend(project_result.errors)
 
-                # Update state
-                if project_key not in state.projects_synced:
-                    state.projects_synced.append(project_key)
+        project_results = await asyncio.gather(
+            *(sync_one(project_key) for project_key in projects_to_sync),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                error_msg = f"Error syncing project {project_key}: {e}"
+        for project_key, project_result in zip(
+            projects_to_sync, project_results, strict=True
+        ):
+            if isinstance(project_result, BaseException):
+                error_msg = f"Error syncing project {project_key}: {project_result}"
                 logger.error(error_msg)
                 result.errors.append(error_msg)
+                continue
+
+            result.issues_processed += project_result.issues_processed
+            result.issues_embedded += project_result.issues_embedded
+            result.issues_skipped += project_result.issues_skipped
+            result.errors.extend(project_result.errors)
+
+            # Update state
+            if project_key not in state.projects_synced:
+                state.projects_synced.append(project_key)
 
         # Finalize state
         state.last_sync_at = datetime.utcnow()
         state.total_issues_indexed = result.issues_embedded
         self._save_state(state)
 
-        result.duration_seconds = (datetime.utcnow() - start_time).total_seconds()
+        result.duration_seconds = time.monotonic() - start_time
         logger.info(
             f"Full sync complete: {result.issues_embedded} issues indexed "
             f"in {result.duration_seconds:.1f}s"
@@ -218,7 +247,7 @@ class VectorSyncEngine:
         Returns:
             SyncResult with statistics
         """
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         result = SyncResult()
         state = self._load_state()
 
@@ -257,19 +286,30 @@ class VectorSyncEngine:
         # Only run deletion detection if we processed a significant number of issues
         # or if it's been a while since last deletion check
         if result.issues_processed > 0:
-            for project_key in projects_to_sync:
-                try:
-                    deleted = await self._detect_and_remove_deleted_issues(project_key)
+            # Projects are independent, so check them concurrently
+            deletion_results = await asyncio.gather(
+                *(
+                    self._detect_and_remove_deleted_issues(project_key)
+                    for project_key in projects_to_sync
+                ),
+                return_exceptions=True,
+            )
+            for project_key, deleted in zip(
+                projects_to_sync, deletion_results, strict=True
+            ):
+                if isinstance(deleted, BaseException):
+                    logger.warning(
+                        f"Deletion detection failed for {project_key}: {deleted}"
+                    )
+                else:
                     result.issues_deleted += deleted
-                except Exception as e:
-                    logger.warning(f"Deletion detection failed for {project_key}: {e}")
 
         # Finalize state
         state.last_sync_at = datetime.utcnow()
         state.total_issues_indexed += result.issues_embedded - result.issues_deleted
         self._save_state(state)
 
-        result.duration_seconds = (datetime.utcnow() - start_time).total_seconds()
+        result.duration_seconds = time.monotonic() - start_time
         logger.info(
             f"Incremental sync complete: {result.issues_embedded} updated, "
             f"{result.issues_deleted} deleted in {result.duration_seconds:.1f}s"
@@ -295,7 +335,9 @@ class VectorSyncEngine:
             Number of deleted issues removed from index
         """
         # Get all indexed issue IDs for this project
-        indexed_ids = self.store.get_all_issue_ids(project_key=project_key)
+        indexed_ids = await asyncio.to_thread(
+            self.store.get_all_issue_ids, project_key=project_key
+        )
         if not indexed_ids:
             return 0
 
@@ -314,7 +356,8 @@ class VectorSyncEngine:
             jql = f"key in ({keys_str})"
 
             try:
-                search_result = self.jira.search_issues(
+                search_result = await asyncio.to_thread(
+                    self.jira.search_issues,
                     jql=jql,
                     fields="key",
                     limit=len(batch),
@@ -331,7 +374,8 @@ class VectorSyncEngine:
                 # Don't delete if we can't verify - could be a transient error
                 continue
 
-        # Remove deleted issues from index
+        # Remove deleted issues from index. This stays on the event loop thread
+        # so concurrent per-project checks don't race on table commits.
         if deleted_ids:
             logger.info(f"Removing {len(deleted_ids)} deleted issues from index: {deleted_ids[:5]}...")
             self.store.delete_issues_by_ids(deleted_ids)
@@ -387,28 +431,45 @@ class VectorSyncEngine:
         synced_ids: set[str] = set()  # Track IDs to prevent cross-batch dupes
         max_updated = state.last_issue_updated
         last_key: str | None = None  # For key-based pagination
+        page_size = self.config.jira_page_size
 
-        while True:
-            try:
-                # Use key-based pagination: fetch issues with key < last_key
-                # Insert the key filter before ORDER BY clause
-                if last_key:
-                    if "ORDER BY" in jql.upper():
-                        parts = jql.upper().split("ORDER BY")
-                        base_jql = jql[: len(parts[0])]
-                        order_part = jql[len(parts[0]) :]
-                        current_jql = f"{base_jql} AND key < '{last_key}' {order_part}"
-                    else:
-                        current_jql = f"{jql} AND key < '{last_key}'"
+        # Split the JQL around ORDER BY once so each page only has to splice in
+        # the key filter
+        order_idx = jql.upper().find("ORDER BY")
+        if order_idx >= 0:
+            base_jql, order_part = jql[:order_idx], jql[order_idx:]
+        else:
+            base_jql, order_part = jql, ""
+
+        async def fetch_page(after_key: str | None) -> Any:
+            # Use key-based pagination: fetch issues with key < after_key
+            # Insert the key filter before ORDER BY clause
+            if after_key:
+                if order_part:
+                    current_jql = f"{base_jql} AND key < '{after_key}' {order_part}"
                 else:
-                    current_jql = jql
+                    current_jql = f"{jql} AND key < '{after_key}'"
+            else:
+                current_jql = jql
+
+            # The Jira client is synchronous; keep the event loop free so
+            # other projects can sync concurrently
+            return await asyncio.to_thread(
+                self.jira.search_issues,
+                jql=current_jql,
+                fields="*all",
+                start=0,  # Always start from 0, use key filter for pagination
+                limit=page_size,  # Cloud fetches this in 100-issue requests
+            )
 
-                search_result = self.jira.search_issues(
-                    jql=current_jql,
-                    fields="*all",
-                    start=0,  # Always start from 0, use key filter for pagination
-                    limit=1000,  # Fetch more per call, internal pagination handles it
-                )
+        # Keyset pagination needs each page's last key, so pages can't be
+        # fetched in parallel; instead the next page is fetched while the
+        # current one is processed and embedded
+        next_page: asyncio.Task[Any] | None = asyncio.create_task(fetch_page(None))
+        while next_page is not None:
+            try:
+                search_result = await next_page
+                next_page = None
 
                 if not search_result.issues:
                     break
@@ -416,6 +477,29 @@ class VectorSyncEngine:
                 # Track the last key for next iteration
                 last_key = search_result.issues[-1].key
 
+                # Server/DC caps a request below page_size (50 by default), so
+                # only a page shorter than what the server would serve is last
+                served = search_result.max_results
+                if 0 < served < page_size:
+                    logger.info(
+                        f"Jira serves at most {served} issues per request "
+                        f"for {project_key} (asked for {page_size})"
+                    )
+                    page_size = served
+                if len(search_result.issues) >= page_size:
+                    # Fetch the next page while this one is being embedded
+                    next_page = asyncio.create_task(fetch_page(last_key))
+
+                # One lookup per page for the stored hashes, rather than a
+                # point query per issue
+                indexed_hashes = (
+                    self.store.get_content_hashes(
+                        [issue.key for issue in search_result.issues]
+                    )
+                    if incremental
+                    else {}
+                )
+
                 for issue in search_result.issues:
                     result.issues_processed += 1
 
@@ -436,11 +520,9 @@ class VectorSyncEngine:
                         status=issue_dict["status"],
                     )
 
-                    if incremental:
-                        existing = self.store.get_issue_by_key(issue_id)
-                        if existing and existing.content_hash == content_hash:
-                            result.issues_skipped += 1
-                            continue
+                    if indexed_hashes.get(issue_id) == content_hash:
+                        result.issues_skipped += 1
+                        continue
 
                     issue_dict["content_hash"] = content_hash
                     issues_to_embed[issue_dict["issue_id"]] = issue_dict  # Dedupe by ID
@@ -474,16 +556,17 @@ class VectorSyncEngine:
                     )
                     issues_to_embed = {}
 
-                # Check if we got fewer results than requested (last page)
-                if len(search_result.issues) < 1000:
-                    break
-
             except Exception as e:
                 error_msg = f"Error fetching issues (last_key={last_key}): {e}"
                 logger.error(error_msg)
                 result.errors.append(error_msg)
                 break
 
+        if next_page is not None:
+            # Processing failed with a prefetch in flight; don't leave it dangling
+            next_page.cancel()
+            await asyncio.gather(next_page, return_exceptions=True)
+
         # Process remaining issues
         if issues_to_embed:
             embedded_count = await self._embed_and_store(
@@ -507,9 +590,7 @@ class VectorSyncEngine:
             # Limit to recently processed issues for incremental sync
             if incremental:
                 # Only sync comments for issues that were just embedded
-                issue_keys_to_sync = [
-                    i["issue_id"] for i in issues_to_embed
-                ] if issues_to_embed else []
+                issue_keys_to_sync = sorted(synced_ids)
             else:
                 issue_keys_to_sync = all_issue_keys[:100]  # Limit for full sync
 
@@ -547,7 +628,8 @@ class VectorSyncEngine:
         # Generate embeddings
         embeddings = await self.embedder.embed_batch(texts)
 
-        # Create embedding records
+        # Create embedding records (one timestamp for the whole batch)
+        indexed_at = datetime.utcnow()
         records = []
         for issue, embedding in zip(issues, embeddings, strict=False):
             record = JiraIssueEmbedding(
@@ -571,7 +653,7 @@ class VectorSyncEngine:
                 linked_issues=issue.get("linked_issues", []),
                 content_hash=issue["content_hash"],
                 embedding_version=self.config.embedding_model,
-                indexed_at=datetime.utcnow(),
+                indexed_at=indexed_at,
             )
             records.append(record)
 
@@ -673,12 +755,13 @@ class VectorSyncEngine:
         # Generate embeddings
         embeddings = await self.embedder.embed_batch(texts)
 
-        # Create embedding records
+        # Create embedding records (one timestamp for the whole batch)
+        now = datetime.utcnow()
         records = []
         for comment, embedding in zip(comments, embeddings, strict=False):
             # Compute content hash for change detection
-            content_hash = hashlib.md5(
-                comment.get("body", "").encode()
+            content_hash = hashlib.blake2b(
+                comment.get("body", "").encode(), digest_size=16
             ).hexdigest()
 
             record = JiraCommentEmbedding(
@@ -687,12 +770,12 @@ class VectorSyncEngine:
                 vector=embedding,
                 body_preview=comment.get("body_preview", ""),
                 author=comment.get("author", "Unknown"),
-                created_at=comment.get("created_at", datetime.utcnow()),
+                created_at=comment.get("created_at", now),
                 project_key=comment.get("project_key", ""),
                 issue_type=comment.get("issue_type", ""),
                 issue_status=comment.get("issue_status", ""),
                 content_hash=content_hash,
-                indexed_at=datetime.utcnow(),
+                indexed_at=now,
             )
             records.append(record)
 
@@ -795,39 +878,42 @@ class VectorSyncEngine:
         Returns:
             Dictionary with required fields
         """
-        # Get description preview
+        # Get description preview; the cleaned text is kept so embedding
+        # doesn't have to strip the markup a second time
         description = issue.description or ""
         if description:
             clean_desc = clean_jira_markup(description)
             description_preview = truncate_at_sentence(clean_desc, max_chars=500)
         else:
+            clean_desc = ""
             description_preview = ""
 
         # Extract project key from issue key
         project_key = issue.key.split("-")[0] if issue.key else ""
 
-        # Get status category
+        # Get status category, preferring the one Jira reports
         status_category = "To Do"
-        if hasattr(issue, "status") and issue.status:
-            if isinstance(issue.status, str):
-                status_name = issue.status.lower()
+        if issue.status:
+            category = issue.status.category
+            reported = _STATUS_CATEGORY_BY_KEY.get(category.key) if category else None
+            if reported:
+                status_category = reported
             else:
-                status_name = str(issue.status).lower()
-            done_terms = ["done", "closed", "resolved", "complete"]
-            progress_terms = ["progress", "review", "testing", "active"]
-            if any(s in status_name for s in done_terms):
-                status_category = "Done"
-            elif any(s in status_name for s in progress_terms):
-                status_category = "In Progress"
-
-        # Get linked issues
+                status_name = issue.status.name.lower()
+                done_terms = ["done", "closed", "resolved", "complete"]
+                progress_terms = ["progress", "review", "testing", "active"]
+                if any(s in status_name for s in done_terms):
+                    status_category = "Done"
+                elif any(s in status_name for s in progress_terms):
+                    status_category = "In Progress"
+
+        # Get linked issue keys
         linked_issues = []
-        if hasattr(issue, "links") and issue.links:
-            for link in issue.links:
-                if hasattr(link, "inward_issue") and link.inward_issue:
-                    linked_issues.append(link.inward_issue)
-                if hasattr(link, "outward_issue") and link.outward_issue:
-                    linked_issues.append(link.outward_issue)
+        for link in issue.issuelinks:
+            if link.inward_issue and link.inward_issue.key:
+                linked_issues.append(link.inward_issue.key)
+            if link.outward_issue and link.outward_issue.key:
+                linked_issues.append(link.outward_issue.key)
 
         # Extract string values from nested objects
         issue_type_name = issue.issue_type.name if issue.issue_type else "Task"
@@ -841,6 +927,7 @@ class VectorSyncEngine:
             "project_key": project_key,
             "summary": issue.summary or "",
             "description": description,
+            "description_clean": clean_desc,
             "description_preview": description_preview,
             "issue_type": issue_type_name,
             "status": status_name,
@@ -877,7 +964,12 @@ class VectorSyncEngine:
             Dictionary with sync statistics
         """
         state = self._load_state()
-        store_stats = self.store.get_stats()
+        cache_key = str(self.config.db_path)
+        store_stats = self._stats_cache.get(cache_key)
+        if store_stats is None:
+            store_stats = self.store.get_stats()
+            if self.config.sync_status_ttl_seconds > 0:
+                self._stats_cache[cache_key] = store_stats
 
         return {
             "last_sync_at": state.last_sync_at.isoformat()
@@ -0,0 +1,160 @@
+"""Semantic cache for generated search answers.
+
+Answers are keyed by the query embedding rather than the query text, so
+repeated and lightly paraphrased questions reuse an earlier GPT answer
+instead of paying for another completion.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Vectors shorter than this have no usable direction once cast to float32
+_MIN_NORM = 1e-12
+
+
+@dataclass
+class CacheEntry:
+    """A cached answer and the sources it was generated from."""
+
+    query: str
+    answer: str
+    sources: list[Any]
+    created_at: float
+    score: float = 1.0
+
+
+class SemanticAnswerCache:
+    """In-memory nearest-neighbour cache of answers by query embedding.
+
+    Vectors are normalized on insert so a lookup is one matrix-vector product
+    against every live entry. Entries are kept in insertion order, which makes
+    both TTL expiry and capacity eviction a trim from the front.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 512,
+        ttl_seconds: float = 24 * 60 * 60,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of cached answers
+            ttl_seconds: Age after which an answer is no longer served
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: list[CacheEntry] = []
+        self._vectors: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: list[float] | np.ndarray) -> np.ndarray | None:
+        arr = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        if not norm >= _MIN_NORM:  # Also rejects NaN
+            return None
+        return arr / norm
+
+    def _drop_front(self, count: int) -> None:
+        if count <= 0:
+            return
+        del self._entries[:count]
+        self._vectors = self._vectors[count:] if self._entries else None
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = 0
+        for entry in self._entries:
+            if entry.created_at >= cutoff:
+                break
+            expired += 1
+        self._drop_front(expired)
+
+    def lookup(self, vector: list[float] | np.ndarray) -> CacheEntry | None:
+        """Find the cached answer closest to a query embedding.
+
+        Args:
+            vector: Query embedding
+
+        Returns:
+            The best entry with its similarity as ``score``, or None if no
+            live entry reaches the threshold
+        """
+        self._expire()
+        if self._vectors is None:
+            return None
+        query = self._normalize(vector)
+        if query is None or query.shape[0] != self._vectors.shape[1]:
+            return None
+
+        similarities = self._vectors @ query
+        best = int(np.argmax(similarities))
+        score = float(similarities[best])
+        if score < self.threshold:
+            return None
+
+        entry = self._entries[best]
+        return CacheEntry(
+            query=entry.query,
+            answer=entry.answer,
+            sources=entry.sources,
+            created_at=entry.created_at,
+            score=score,
+        )
+
+    def store(
+        self,
+        vector: list[float] | np.ndarray,
+        query: str,
+        answer: str,
+        sources: list[Any],
+    ) -> None:
+        """Cache an answer under its query embedding.
+
+        Args:
+            vector: Query embedding
+            query: Original query text
+            answer: Generated answer
+            sources: Sources returned alongside the answer
+        """
+        normalized = self._normalize(vector)
+        if normalized is None:
+            return
+        if self._vectors is not None and normalized.shape[0] != self._vectors.shape[1]:
+            # Embedding model changed; older vectors aren't comparable
+            self.clear()
+
+        self._expire()
+        self._entries.append(
+            CacheEntry(
+                query=query,
+                answer=answer,
+                sources=sources,
+                created_at=time.monotonic(),
+            )
+        )
+        row = normalized[np.newaxis, :]
+        if self._vectors is None:
+            self._vectors = row
+        else:
+            self._vectors = np.vstack([self._vectors, row])
+        self._drop_front(len(self._entries) - self.max_entries)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self._entries.clear()
+        self._vectors = None
@@ -3,22 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import logging
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, TypeVar
 
-from fastapi import FastAPI, HTTPException
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from openai import AsyncOpenAI
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 from pydantic import BaseModel
 
 from mcp_atlassian.jira import JiraFacade
-from mcp_atlassian.vector.config import VectorConfig
+from mcp_atlassian.vector.config import EmbeddingProvider, get_cached_config
 from mcp_atlassian.vector.embeddings import EmbeddingPipeline
 from mcp_atlassian.vector.scheduler import SyncScheduler
 from mcp_atlassian.vector.store import LanceDBStore
+from mcp_atlassian.vector.sync import SyncResult
+from mcp_atlassian.web.semantic_cache import CacheEntry, SemanticAnswerCache
 
 logger = logging.getLogger(__name__)
+if _log_level := os.getenv("WEB_LOG_LEVEL"):
+    logger.setLevel(_log_level.upper())
 
 # Global instances
 _store: LanceDBStore | None = None
@@ -27,6 +40,58 @@ _openai: AsyncOpenAI | None = None
 _jira: JiraFacade | None = None
 _scheduler: SyncScheduler | None = None
 
+# Per-route request metrics, exposed at /metrics
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "HTTP requests handled",
+    ["method", "route", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route"],
+)
+
+ANSWER_CACHE_HITS = Counter(
+    "answer_cache_hits_total",
+    "Search answers served from the semantic answer cache",
+)
+
+# Answers for repeated or paraphrased questions, keyed by query embedding
+_answer_cache = SemanticAnswerCache()
+
+# Store columns the search endpoints render; skips reading the vector back
+_RESULT_COLUMNS = [
+    "issue_id",
+    "summary",
+    "status",
+    "issue_type",
+    "project_key",
+    "assignee",
+    "description_preview",
+    "labels",
+]
+
+# Locks for query texts currently being embedded
+_embed_locks: dict[str, asyncio.Lock] = {}
+
+# /api/search pipelines currently running, by query text
+_inflight_searches: dict[str, asyncio.Task[SearchResponse]] = {}
+
+# Query vector, answer cache hit, and vector search results for a query
+_Retrieval = tuple[list[float], CacheEntry | None, list[dict[str, Any]]]
+
+# Retrievals currently running, by query text; shared by both search endpoints
+_inflight_retrievals: dict[str, asyncio.Task[_Retrieval]] = {}
+
+_T = TypeVar("_T")
+
+# Store stats snapshot for polled endpoints: (fetched_at, stats)
+_stats_cache: tuple[float, dict[str, Any]] | None = None
+_STATS_TTL_SECONDS = 5.0
+_STATS_MAX_STALE_SECONDS = 60.0
+_stats_refresh: asyncio.Task[dict[str, Any]] | None = None
+
 
 def get_jira() -> JiraFacade:
     """Get or create Jira facade."""
@@ -40,7 +105,7 @@ def get_store() -> LanceDBStore:
     """Get or create the LanceDB store."""
     global _store
     if _store is None:
-        _store = LanceDBStore()
+        _store = LanceDBStore(config=get_cached_config())
     return _store
 
 
@@ -48,18 +113,138 @@ def get_pipeline() -> EmbeddingPipeline:
     """Get or create the embedding pipeline."""
     global _pipeline
     if _pipeline is None:
-        _pipeline = EmbeddingPipeline()
+        config = get_cached_config()
+        # Share the answer client's connection pool for embedding calls
+        client = get_openai() if config.embedding_provider == EmbeddingProvider.OPENAI else None
+        _pipeline = EmbeddingPipeline(config=config, client=client)
     return _pipeline
 
 
+async def embed_query(query: str) -> list[float]:
+    """Embed a search query, merging concurrent requests for the same text.
+
+    The pipeline keeps recent vectors in its in-memory cache, so only the
+    first of several simultaneous requests for an uncached query reaches
+    the embedding provider; the rest wait for it and then hit that cache.
+
+    Args:
+        query: Query text, already stripped.
+    """
+    lock = _embed_locks.setdefault(query, asyncio.Lock())
+    try:
+        async with lock:
+            return await get_pipeline().embed(query)
+    finally:
+        if _embed_locks.get(query) is lock and not lock.locked():
+            del _embed_locks[query]
+
+
+def get_store_stats(fresh: bool = False) -> dict[str, Any]:
+    """Get vector store stats, reusing a snapshot younger than the TTL.
+
+    The snapshot is stamped after the query completes so a slow count
+    doesn't eat into the entry's lifetime.
+
+    Args:
+        fresh: Bypass the cached snapshot and refresh it.
+    """
+    global _stats_cache
+    if not fresh and _stats_cache is not None:
+        fetched_at, stats = _stats_cache
+        if time.monotonic() - fetched_at < _STATS_TTL_SECONDS:
+            return stats
+    stats = get_store().get_stats()
+    _stats_cache = (time.monotonic(), stats)
+    return stats
+
+
+async def store_stats(fresh: bool = False) -> dict[str, Any]:
+    """Get store stats without blocking the event loop, stale-while-revalidate.
+
+    A snapshot past the TTL is still served while a single background refresh
+    runs, so polled endpoints rarely pay for the count. Nothing refreshes while
+    the server is idle; a snapshot older than ``_STATS_MAX_STALE_SECONDS`` is
+    refreshed inline instead of being served.
+
+    Args:
+        fresh: Wait for a freshly counted snapshot.
+    """
+    global _stats_refresh
+    snapshot = _stats_cache
+    age = time.monotonic() - snapshot[0] if snapshot else None
+    if fresh or age is None or age >= _STATS_MAX_STALE_SECONDS:
+        return await asyncio.to_thread(functools.partial(get_store_stats, fresh=True))
+    stats = snapshot[1]
+    if age >= _STATS_TTL_SECONDS and _stats_refresh is None:
+        _stats_refresh = asyncio.create_task(
+            asyncio.to_thread(functools.partial(get_store_stats, fresh=True))
+        )
+        _stats_refresh.add_done_callback(_stats_refreshed)
+    return stats
+
+
+def _stats_refreshed(task: asyncio.Task[dict[str, Any]]) -> None:
+    """Clear the in-flight refresh and log its failure, if any."""
+    global _stats_refresh
+    _stats_refresh = None
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Stats refresh failed: %s", task.exception())
+
+
+def cacheable_response(
+    request: Request, payload: dict[str, Any], max_age: int = 5
+) -> Response:
+    """Build a JSON response with a weak ETag for polled GET endpoints.
+
+    Returns an empty 304 when the client's ``If-None-Match`` already matches
+    the payload, so dashboards polling unchanged state skip the body.
+
+    Args:
+        request: Incoming request, checked for ``If-None-Match``.
+        payload: JSON-serializable response body.
+        max_age: Seconds the client may reuse the response without revalidating.
+    """
+    body = orjson.dumps(payload)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={max_age}, stale-while-revalidate=30",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def get_openai() -> AsyncOpenAI:
-    """Get or create the OpenAI client."""
+    """Get or create the OpenAI client.
+
+    Uses a pooled HTTP client so concurrent completions reuse keep-alive
+    connections instead of opening new ones.
+    """
     global _openai
     if _openai is None:
-        _openai = AsyncOpenAI()
+        _openai = AsyncOpenAI(
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        )
     return _openai
 
 
+async def _warm_openai() -> None:
+    """Open the OpenAI connection pool so the first search skips the TLS handshake."""
+    try:
+        await get_openai().models.list()
+    except Exception as e:
+        logger.warning("OpenAI warmup failed: %s", e)
+
+
+def _on_sync(result: SyncResult) -> None:
+    """Drop cached answers once a sync has changed the index."""
+    if result.issues_embedded or result.issues_deleted:
+        _answer_cache.clear()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize resources on startup."""
@@ -68,24 +253,28 @@ async def lifespan(app: FastAPI):
     # Pre-initialize connections
     get_store()
     get_pipeline()
-    get_openai()
+    warmup_task = asyncio.create_task(_warm_openai())
 
     # Start background sync scheduler
-    config = VectorConfig.from_env()
+    config = get_cached_config()
     if config.sync_interval_minutes > 0:
         try:
             jira = get_jira()
-            _scheduler = SyncScheduler(jira, config=config)
+            _scheduler = SyncScheduler(jira, config=config, on_sync=_on_sync)
             await _scheduler.start()
-            logger.info(f"Background sync enabled (interval: {config.sync_interval_minutes} min)")
+            logger.info("Background sync enabled (interval: %s min)", config.sync_interval_minutes)
         except Exception as e:
-            logger.warning(f"Background sync disabled - Jira not configured: {e}")
+            logger.warning("Background sync disabled - Jira not configured: %s", e)
             _scheduler = None
     else:
         logger.info("Background sync disabled (VECTOR_SYNC_INTERVAL_MINUTES=0)")
 
     yield
 
+    warmup_task.cancel()
+    if _openai is not None:
+        await _openai.close()
+
     # Stop background sync scheduler
     if _scheduler:
         await _scheduler.stop()
@@ -97,6 +286,7 @@ app = FastAPI(
     description="Semantic search API for Jira issues",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for local development
@@ -114,6 +304,31 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Record per-route request counts and latency."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template so path parameters don't explode cardinality
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        REQUEST_DURATION.labels(request.method, path).observe(
+            time.perf_counter() - start
+        )
+        REQUEST_COUNT.labels(request.method, path, str(status)).inc()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose request metrics in Prometheus text format."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 class SearchRequest(BaseModel):
     """Search request payload."""
     query: str
@@ -151,96 +366,247 @@ Guidelines:
 - Don't make up information not in the search results"""
 
 
-async def generate_answer(query: str, results: list[dict[str, Any]]) -> str:
-    """Generate an answer using GPT based on search results."""
-    if not results:
-        return "I couldn't find any relevant Jira issues matching your query. Try rephrasing or being more specific."
-
-    # Format search results for context
-    context_parts = []
-    for i, r in enumerate(results[:10], 1):
-        issue_id = r.get("issue_id", "Unknown")
-        summary = r.get("summary", "No summary")
-        status = r.get("status", "Unknown")
-        assignee = r.get("assignee", "Unassigned")
-        desc_preview = r.get("description_preview", "")[:500] if r.get("description_preview") else ""
-
-        context_parts.append(
-            f"{i}. [{issue_id}] {summary}\n"
-            f"   Status: {status} | Assignee: {assignee}\n"
-            f"   {desc_preview}"
-        )
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
 
-    context = "\n\n".join(context_parts)
+NO_RESULTS_ANSWER = (
+    "I couldn't find any relevant Jira issues matching your query. "
+    "Try rephrasing or being more specific."
+)
+
+
+def _format_result(index: int, r: dict[str, Any]) -> str:
+    """Format one search result as a numbered context entry."""
+    desc_preview = (r.get("description_preview") or "")[:500]
+    return (
+        f"{index}. [{r.get('issue_id', 'Unknown')}] {r.get('summary', 'No summary')}\n"
+        f"   Status: {r.get('status', 'Unknown')} | Assignee: {r.get('assignee', 'Unassigned')}\n"
+        f"   {desc_preview}"
+    )
+
+
+def _answer_messages(query: str, results: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """Build the chat messages for answering a query from search results."""
+    context = "\n\n".join(
+        _format_result(i, r) for i, r in enumerate(results[:10], 1)
+    )
+    return [
+        _SYSTEM_MESSAGE,
+        {
+            "role": "user",
+            "content": f"User question: {query}\n\nRelevant Jira issues:\n\n{context}",
+        },
+    ]
+
+
+async def generate_answer(
+    query: str, results: list[dict[str, Any]]
+) -> tuple[str, bool]:
+    """Generate an answer using GPT based on search results.
+
+    Returns the answer and whether the LLM produced it; placeholder and
+    fallback answers come back with False so they are never cached.
+    """
+    if not results:
+        return NO_RESULTS_ANSWER, False
 
     try:
         client = get_openai()
         response = await client.chat.completions.create(
             model="gpt-4.1",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": f"User question: {query}\n\nRelevant Jira issues:\n\n{context}",
-                },
-            ],
+            messages=_answer_messages(query, results),
             temperature=0.3,
             max_tokens=1000,
         )
-        return response.choices[0].message.content or "Unable to generate response."
+        content = response.choices[0].message.content
+        if not content:
+            return "Unable to generate response.", False
+        return content, True
     except Exception as e:
-        logger.error(f"Error generating answer: {e}")
-        # Fallback to simple summary
-        issue_list = ", ".join(r.get("issue_id", "?") for r in results[:5])
-        return f"Found {len(results)} relevant issues: {issue_list}. Check the sources below for details."
+        logger.error("Error generating answer: %s", e)
+        return _fallback_answer(results), False
+
+
+def _fallback_answer(results: list[dict[str, Any]]) -> str:
+    """Summarize search results without the LLM."""
+    issue_list = ", ".join(r.get("issue_id", "?") for r in results[:5])
+    return f"Found {len(results)} relevant issues: {issue_list}. Check the sources below for details."
+
+
+def _to_sources(results: list[dict[str, Any]]) -> list[JiraSource]:
+    """Format search results as sources with clamped scores."""
+    return [
+        JiraSource(
+            issue_id=r.get("issue_id", ""),
+            summary=r.get("summary", ""),
+            status=r.get("status", "Unknown"),
+            issue_type=r.get("issue_type", "Unknown"),
+            project_key=r.get("project_key", ""),
+            assignee=r.get("assignee"),
+            description_preview=r.get("description_preview", "")[:200] if r.get("description_preview") else None,
+            score=max(0.0, min(1.0, r.get("score", 0.0))),  # Clamp to [0, 1]
+        )
+        for r in results
+    ]
+
+
+def _sse(payload: dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+# Final frame of an answer stream
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+async def _coalesced(
+    inflight: dict[str, asyncio.Task[_T]],
+    query: str,
+    run: Callable[[], Awaitable[_T]],
+) -> _T:
+    """Join the task already running for ``query``, or start one.
+
+    The task is shielded so one caller being cancelled (a client
+    disconnecting) doesn't cancel it for the others.
+    """
+    task = inflight.get(query)
+    if task is None:
+        task = asyncio.ensure_future(run())
+        inflight[query] = task
+        task.add_done_callback(lambda _: inflight.pop(query, None))
+    return await asyncio.shield(task)
+
+
+async def _run_retrieval(query: str) -> _Retrieval:
+    """Embed a query, then check the answer cache or search the store.
+
+    Results are empty on an answer cache hit.
+    """
+    query_vector = await embed_query(query)
+
+    hit = _answer_cache.lookup(query_vector)
+    if hit is not None:
+        return query_vector, hit, []
+
+    results, _ = await asyncio.to_thread(
+        get_store().search_issues, query_vector, limit=10, columns=_RESULT_COLUMNS
+    )
+    return query_vector, None, results
+
+
+async def _retrieve(query: str) -> _Retrieval:
+    """Retrieve context for a query, sharing any identical retrieval in flight."""
+    return await _coalesced(_inflight_retrievals, query, lambda: _run_retrieval(query))
+
+
+async def _run_search(query: str) -> SearchResponse:
+    """Embed, search, and answer a query."""
+    query_vector, hit, results = await _retrieve(query)
+    if hit is not None:
+        ANSWER_CACHE_HITS.inc()
+        return SearchResponse(answer=hit.answer, sources=hit.sources)
+
+    # Generate answer
+    answer, generated = await generate_answer(query, results)
+
+    sources = _to_sources(results)
+
+    # Only cache real LLM answers, not the no-results or fallback text
+    if generated:
+        _answer_cache.store(query_vector, query, answer, sources)
+
+    return SearchResponse(answer=answer, sources=sources)
 
 
 @app.post("/api/search", response_model=SearchResponse)
 async def search(request: SearchRequest) -> SearchResponse:
-    """Search Jira issues and generate an answer."""
+    """Search Jira issues and generate an answer.
+
+    Identical queries that arrive while one is already in flight share its
+    result instead of each running the embed/search/GPT pipeline.
+    """
     query = request.query.strip()
     if not query:
         raise HTTPException(status_code=400, detail="Query is required")
 
     try:
-        # Generate query embedding
-        pipeline = get_pipeline()
-        query_vector = await pipeline.embed(query)
+        return await _coalesced(_inflight_searches, query, lambda: _run_search(query))
+    except Exception as e:
+        logger.exception("Search error: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Search the vector store
-        store = get_store()
-        results, _ = store.search_issues(query_vector, limit=10)
-
-        # Generate answer
-        answer = await generate_answer(query, results)
-
-        # Format sources with clamped scores
-        sources = [
-            JiraSource(
-                issue_id=r.get("issue_id", ""),
-                summary=r.get("summary", ""),
-                status=r.get("status", "Unknown"),
-                issue_type=r.get("issue_type", "Unknown"),
-                project_key=r.get("project_key", ""),
-                assignee=r.get("assignee"),
-                description_preview=r.get("description_preview", "")[:200] if r.get("description_preview") else None,
-                score=max(0.0, min(1.0, r.get("score", 0.0))),  # Clamp to [0, 1]
-            )
-            for r in results
-        ]
 
-        return SearchResponse(answer=answer, sources=sources)
+@app.post("/api/search/stream")
+async def search_stream(request: SearchRequest) -> StreamingResponse:
+    """Search Jira issues and stream the answer as Server-Sent Events.
+
+    Emits a ``sources`` frame as soon as the vector search finishes, then
+    ``delta`` frames as answer tokens arrive, then a final ``[DONE]`` frame.
+    Retrieval is shared with identical queries already in flight on either
+    search endpoint.
+    """
+    query = request.query.strip()
+    if not query:
+        raise HTTPException(status_code=400, detail="Query is required")
 
+    try:
+        query_vector, hit, results = await _retrieve(query)
     except Exception as e:
-        logger.exception(f"Search error: {e}")
+        logger.exception("Search error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+    async def event_stream() -> AsyncIterator[bytes]:
+        if hit is not None:
+            ANSWER_CACHE_HITS.inc()
+            yield _sse({"sources": [src.model_dump() for src in hit.sources]})
+            yield _sse({"delta": hit.answer})
+            yield _SSE_DONE
+            return
+
+        sources = _to_sources(results)
+        yield _sse({"sources": [src.model_dump() for src in sources]})
+
+        if not results:
+            yield _sse({"delta": NO_RESULTS_ANSWER})
+            yield _SSE_DONE
+            return
+
+        parts: list[str] = []
+        try:
+            stream = await get_openai().chat.completions.create(
+                model="gpt-4.1",
+                messages=_answer_messages(query, results),
+                temperature=0.3,
+                max_tokens=1000,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield _sse({"delta": delta})
+        except Exception as e:
+            logger.error("Error streaming answer: %s", e)
+            if not parts:
+                yield _sse({"delta": _fallback_answer(results)})
+            yield _SSE_DONE
+            return
+
+        if parts:
+            _answer_cache.store(query_vector, query, "".join(parts), sources)
+        yield _SSE_DONE
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 
 @app.get("/api/health")
-async def health():
-    """Health check endpoint."""
-    store = get_store()
-    stats = store.get_stats()
+async def health(request: Request, fresh: bool = False):
+    """Health check endpoint.
+
+    Store stats are cached for a few seconds; pass ``?fresh=1`` to bypass.
+    """
+    stats = await store_stats(fresh=fresh)
     response = {
         "status": "healthy",
         "indexed_issues": stats.get("total_issues", 0),
@@ -249,21 +615,21 @@ async def health():
     # Include sync status if scheduler is running
     if _scheduler:
         response["sync"] = _scheduler.status
-    return response
+    return cacheable_response(request, response)
 
 
 @app.get("/api/sync/status")
-async def sync_status():
+async def sync_status(request: Request):
     """Get background sync status."""
     if not _scheduler:
-        return {
+        return cacheable_response(request, {
             "enabled": False,
             "message": "Background sync not configured"
-        }
-    return {
+        })
+    return cacheable_response(request, {
         "enabled": True,
         **_scheduler.status
-    }
+    })
 
 
 @app.post("/api/sync/trigger")
@@ -284,7 +650,7 @@ async def trigger_sync():
             "errors": len(result.errors),
         }
     except Exception as e:
-        logger.error(f"Manual sync failed: {e}")
+        logger.error("Manual sync failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -308,17 +674,21 @@ async def vector_search(request: VectorSearchRequest):
         raise HTTPException(status_code=400, detail="Query is required")
 
     try:
-        logger.info(f"Vector search: query='{query}', limit={request.limit}")
-        pipeline = get_pipeline()
-        query_vector = await pipeline.embed(query)
-        logger.info(f"Generated embedding with {len(query_vector)} dimensions")
+        logger.info("Vector search: query='%s', limit=%s", query, request.limit)
+        # Embedding and the stats count are independent; run them together
+        query_vector, stats = await asyncio.gather(
+            embed_query(query),
+            store_stats(),
+        )
+        logger.info("Generated embedding with %s dimensions", len(query_vector))
+        logger.info("Vector store stats: %s issues indexed", stats.get('total_issues', 0))
 
         store = get_store()
-        stats = store.get_stats()
-        logger.info(f"Vector store stats: {stats.get('total_issues', 0)} issues indexed")
 
-        results, total_count = store.search_issues(query_vector, limit=request.limit)
-        logger.info(f"Vector search returned {len(results)} results (total matching: {total_count})")
+        results, total_count = await asyncio.to_thread(
+            store.search_issues, query_vector, limit=request.limit, columns=_RESULT_COLUMNS
+        )
+        logger.info("Vector search returned %s results (total matching: %s)", len(results), total_count)
 
         # Format results
         issues = [
@@ -339,7 +709,7 @@ async def vector_search(request: VectorSearchRequest):
         return {"issues": issues, "count": len(issues)}
 
     except Exception as e:
-        logger.exception(f"Vector search error: {e}")
+        logger.exception("Vector search error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -353,10 +723,10 @@ class GenerateAnswerRequest(BaseModel):
 async def generate_answer_endpoint(request: GenerateAnswerRequest):
     """Generate an answer from search results using LLM."""
     try:
-        answer = await generate_answer(request.query, request.issues)
+        answer, _ = await generate_answer(request.query, request.issues)
         return {"answer": answer}
     except Exception as e:
-        logger.exception(f"Answer generation error: {e}")
+        logger.exception("Answer generation error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -371,7 +741,7 @@ async def jql_search(request: JQLSearchRequest):
     try:
         jira = get_jira()
     except Exception as e:
-        logger.warning(f"Jira not configured: {e}")
+        logger.warning("Jira not configured: %s", e)
         return {
             "issues": [],
             "count": 0,
@@ -381,7 +751,7 @@ async def jql_search(request: JQLSearchRequest):
 
     try:
         # Use the search method from JiraFacade - returns JiraSearchResult
-        result = jira.search_issues(jql, limit=request.limit)
+        result = await asyncio.to_thread(jira.search_issues, jql, limit=request.limit)
 
         # Format results to match vector search format
         issues = []
@@ -408,7 +778,7 @@ async def jql_search(request: JQLSearchRequest):
 
     except Exception as e:
         # Return structured error instead of 500
-        logger.warning(f"JQL search error: {e}")
+        logger.warning("JQL search error: %s", e)
         error_msg = str(e)
         suggestion = "Check your JQL syntax or use semantic search"
         if "401" in error_msg or "not authenticated" in error_msg.lower():
@@ -428,6 +798,35 @@ class LinkedIssuesRequest(BaseModel):
     issueKey: str
 
 
+async def _search_linked_issues_by_key(jira: JiraFacade, issue_key: str) -> Any:
+    """Fetch linked issues by reading the issue's links, then searching by key.
+
+    Fallback for Jira instances where the ``linkedIssues()`` JQL function
+    isn't available. Returns None when the issue has no links.
+    """
+    # Get raw issue data with links using the underlying Jira client
+    raw_issue = await asyncio.to_thread(jira.jira.get_issue, issue_key)
+
+    # Extract linked issue keys from the raw issue data
+    linked_keys: list[str] = []
+    issuelinks = raw_issue.get('fields', {}).get('issuelinks', [])
+    logger.info("Found %s issue links for %s", len(issuelinks), issue_key)
+
+    for link in issuelinks:
+        # Links can be inward or outward
+        if 'outwardIssue' in link:
+            linked_keys.append(link['outwardIssue']['key'])
+        if 'inwardIssue' in link:
+            linked_keys.append(link['inwardIssue']['key'])
+
+    if not linked_keys:
+        return None
+
+    # Fetch the linked issues
+    jql = f"key in ({','.join(linked_keys)})"
+    return await asyncio.to_thread(jira.search_issues, jql, limit=20)
+
+
 @app.post("/api/linked-issues")
 async def get_linked_issues(request: LinkedIssuesRequest):
     """Get issues linked to a specific issue."""
@@ -439,7 +838,7 @@ async def get_linked_issues(request: LinkedIssuesRequest):
     try:
         jira = get_jira()
     except Exception as e:
-        logger.warning(f"Jira not configured: {e}")
+        logger.warning("Jira not configured: %s", e)
         return {
             "issues": [],
             "count": 0,
@@ -447,27 +846,17 @@ async def get_linked_issues(request: LinkedIssuesRequest):
         }
 
     try:
-        # Get raw issue data with links using the underlying Jira client
-        raw_issue = jira.jira.get_issue(issue_key)
-
-        # Extract linked issue keys from the raw issue data
-        linked_keys: list[str] = []
-        issuelinks = raw_issue.get('fields', {}).get('issuelinks', [])
-        logger.info(f"Found {len(issuelinks)} issue links for {issue_key}")
-
-        for link in issuelinks:
-            # Links can be inward or outward
-            if 'outwardIssue' in link:
-                linked_keys.append(link['outwardIssue']['key'])
-            if 'inwardIssue' in link:
-                linked_keys.append(link['inwardIssue']['key'])
-
-        if not linked_keys:
-            return {"issues": [], "count": 0}
-
-        # Fetch the linked issues
-        jql = f"key in ({','.join(linked_keys)})"
-        result = jira.search_issues(jql, limit=20)
+        # One round trip: let Jira resolve the links server-side
+        quoted_key = issue_key.replace('"', '\\"')
+        try:
+            result = await asyncio.to_thread(
+                jira.search_issues, f'issue in linkedIssues("{quoted_key}")', limit=20
+            )
+        except Exception as e:
+            logger.info("linkedIssues() JQL failed for %s, reading links directly: %s", issue_key, e)
+            result = await _search_linked_issues_by_key(jira, issue_key)
+            if result is None:
+                return {"issues": [], "count": 0}
 
         # Format results
         issues = []
@@ -491,7 +880,7 @@ async def get_linked_issues(request: LinkedIssuesRequest):
         return {"issues": issues, "count": len(issues)}
 
     except Exception as e:
-        logger.warning(f"Linked issues error for {issue_key}: {e}")
+        logger.warning("Linked issues error for %s: %s", issue_key, e)
         return {
             "issues": [],
             "count": 0,
@@ -500,13 +889,22 @@ async def get_linked_issues(request: LinkedIssuesRequest):
 
 
 def main():
-    """Run the server."""
+    """Run the server.
+
+    ``WEB_WORKERS`` sets the number of worker processes (default 1). Each
+    worker runs its own sync scheduler and caches, so enable background sync
+    in only one deployment when scaling out. Auto-reload (``WEB_RELOAD``,
+    default on) only applies to a single worker.
+    """
     import uvicorn
+    workers = int(os.getenv("WEB_WORKERS", "1"))
+    reload = os.getenv("WEB_RELOAD", "true").lower() in ("true", "1", "yes")
     uvicorn.run(
         "mcp_atlassian.web.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload and workers == 1,
+        workers=workers,
     )
 
 
@@ -1,10 +1,17 @@
 """Tests for the vector config module."""
 
+import inspect
 import os
+import re
 from pathlib import Path
 from unittest.mock import patch
 
-from mcp_atlassian.vector.config import EmbeddingProvider, VectorConfig
+from mcp_atlassian.vector import config as config_module
+from mcp_atlassian.vector.config import (
+    EmbeddingProvider,
+    VectorConfig,
+    get_cached_config,
+)
 
 
 def test_from_env_defaults():
@@ -149,3 +156,44 @@ def test_cache_embeddings_disabled():
     with patch.dict(os.environ, {"VECTOR_CACHE_EMBEDDINGS": "false"}, clear=True):
         config = VectorConfig.from_env()
         assert config.cache_embeddings is False
+
+
+def test_get_cached_config_reads_env_once():
+    """Test that the cached config is built once and then reused."""
+    get_cached_config.cache_clear()
+    try:
+        with patch.dict(os.environ, {"VECTOR_BATCH_SIZE": "7"}, clear=True):
+            config = get_cached_config()
+        with patch.dict(os.environ, {"VECTOR_BATCH_SIZE": "9"}, clear=True):
+            assert get_cached_config() is config
+        assert config.batch_size == 7
+    finally:
+        get_cached_config.cache_clear()
+
+
+def test_from_env_returns_independent_copies():
+    """Test that memoized from_env results can be modified safely."""
+    with patch.dict(os.environ, {"VECTOR_SYNC_PROJECTS": "PROJ"}, clear=True):
+        first = VectorConfig.from_env()
+        first.sync_projects.append("ENG")
+        first.batch_size = 1
+
+        second = VectorConfig.from_env()
+        assert second is not first
+        assert second.sync_projects == ["PROJ"]
+        assert second.batch_size == 100
+
+
+def test_from_env_tracks_env_changes():
+    """Test that a changed environment is re-parsed without reload()."""
+    with patch.dict(os.environ, {"VECTOR_BATCH_SIZE": "7"}, clear=True):
+        assert VectorConfig.from_env().batch_size == 7
+    with patch.dict(os.environ, {"VECTOR_BATCH_SIZE": "9"}, clear=True):
+        assert VectorConfig.from_env().batch_size == 9
+
+
+def test_env_vars_cover_every_getenv():
+    """Test that the from_env cache key includes every variable read."""
+    source = inspect.getsource(config_module)
+    read = set(re.findall(r'os\.getenv\(\s*"([A-Z_]+)"', source))
+    assert read == set(config_module._ENV_VARS)
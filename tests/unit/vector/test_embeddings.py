@@ -1,12 +1,19 @@
 """Tests for the vector embeddings module."""
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from mcp_atlassian.vector.config import EmbeddingProvider, VectorConfig
-from mcp_atlassian.vector.embeddings import EmbeddingPipeline, chunked
+from mcp_atlassian.vector.embeddings import (
+    EmbeddingMatrix,
+    EmbeddingPipeline,
+    PersistentEmbeddingCache,
+    chunked,
+)
 
 
 def test_chunked():
@@ -29,6 +36,10 @@ def test_chunked():
     result = chunked([], 3)
     assert result == []
 
+    # Non-list iterables are consumed lazily
+    result = chunked((i for i in items), 4)
+    assert result == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
 
 def test_embedding_pipeline_init():
     """Test EmbeddingPipeline initialization."""
@@ -40,7 +51,7 @@ def test_embedding_pipeline_init():
 
     assert pipeline.config == config
     assert pipeline._client is None
-    assert pipeline._memory_cache == {}  # Memory cache for hot access
+    assert len(pipeline._memory_cache) == 0  # Memory cache for hot access
     assert pipeline._persistent_cache is None  # Lazy-loaded
 
 
@@ -54,7 +65,13 @@ def test_embedding_pipeline_cache_key():
 
     assert key1 == key2
     assert key1 != key3
-    assert len(key1) == 32  # MD5 hex digest
+    assert len(key1) == 32  # 16-byte BLAKE2b hex digest
+
+    # Different models never share cache entries
+    other = EmbeddingPipeline(
+        config=VectorConfig(embedding_model="text-embedding-3-large")
+    )
+    assert other._get_cache_key("hello world") != key1
 
 
 def test_clear_cache():
@@ -86,6 +103,66 @@ def test_cache_stats():
     assert "memory_cache_mb" in stats
 
 
+def test_embedding_matrix_grows_and_overwrites():
+    """Test the contiguous memory cache keeps rows addressable as it grows."""
+    cache = EmbeddingMatrix(initial_capacity=2)
+    for i in range(5):
+        cache[f"key{i}"] = [float(i), 0.5]
+
+    assert len(cache) == 5
+    assert cache.vectors.shape == (5, 2)
+    assert cache.nbytes == 8 * 2 * 4  # capacity doubled 2 -> 4 -> 8
+    assert cache["key3"] == [3.0, 0.5]
+
+    cache["key3"] = [9.0, 9.0]
+    assert len(cache) == 5
+    assert cache["key3"] == [9.0, 9.0]
+
+    # A different dimension means a new model; stale rows are dropped
+    cache["new"] = [1.0, 2.0, 3.0]
+    assert len(cache) == 1
+    assert "key0" not in cache
+
+
+def test_embedding_matrix_int8_quantization():
+    """Test int8 rows dequantize close to the original and use a quarter of the memory."""
+    embedding = [0.5, -0.25, 0.125, 0.0] * 384
+    full = EmbeddingMatrix(initial_capacity=4)
+    quantized = EmbeddingMatrix(initial_capacity=4, quantize=True)
+    full["key"] = embedding
+    quantized["key"] = embedding
+
+    assert quantized["key"] == pytest.approx(embedding, abs=0.5 / 127)
+    assert quantized.vectors.dtype == np.float32
+    assert quantized.nbytes < full.nbytes / 3
+
+    quantized.clear()
+    quantized["zeros"] = [0.0] * 4
+    assert quantized["zeros"] == [0.0] * 4
+
+
+def test_persistent_cache_round_trip(tmp_path):
+    """Test the persistent cache stores float32 blobs and reads legacy JSON rows."""
+    cache = PersistentEmbeddingCache(tmp_path / "cache.db")
+    cache.set_many([("a", [0.5, 0.25]), ("b", [1.0, -1.0])])
+    cache.set("c", [0.125])
+
+    assert cache.get("a") == [0.5, 0.25]
+    assert cache.get("b") == [1.0, -1.0]
+    assert cache.get("c") == [0.125]
+    assert cache.get("missing") is None
+    assert cache.stats()["cached_embeddings"] == 3
+
+    # Rows written before the blob format was introduced
+    conn = cache._get_conn()
+    conn.execute(
+        "INSERT INTO embeddings VALUES (?, ?, ?, ?)", ("legacy", "[0.1, 0.2]", 0, 0)
+    )
+    conn.commit()
+    assert cache.get("legacy") == [0.1, 0.2]
+    cache.close()
+
+
 @pytest.mark.asyncio
 async def test_embed_with_cache():
     """Test that embedding uses cache correctly."""
@@ -102,7 +179,7 @@ async def test_embed_with_cache():
 
     # Should return cached value without calling API
     result = await pipeline.embed("test text")
-    assert result == cached_embedding
+    assert result == pytest.approx(cached_embedding)
 
 
 @pytest.mark.asyncio
@@ -145,10 +222,103 @@ async def test_embed_batch_with_partial_cache():
         mock_embed.assert_called_once_with(["uncached text"])
 
         # Results should be in correct order
-        assert result[0] == cached_embedding
+        assert result[0] == pytest.approx(cached_embedding)
         assert result[1] == [0.4, 0.5, 0.6]
 
 
+@pytest.mark.asyncio
+async def test_embed_fuzzy_cache_reuses_near_duplicate():
+    """Test that a near-identical text reuses the cached embedding when enabled."""
+    config = VectorConfig(
+        cache_embeddings=False,
+        fuzzy_cache=True,
+        embedding_provider=EmbeddingProvider.OPENAI,
+    )
+    pipeline = EmbeddingPipeline(config=config)
+    text = "Checkout page times out when the cart has more than fifty line items in it"
+
+    with patch.object(
+        pipeline, "_embed_openai", new_callable=AsyncMock
+    ) as mock_embed:
+        mock_embed.return_value = [[0.25, 0.5]]
+        first = await pipeline.embed(text)
+        second = await pipeline.embed(text + "  ")
+
+    mock_embed.assert_called_once()
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_dedupes_repeated_texts():
+    """Test that identical uncached texts in one batch are embedded once."""
+    config = VectorConfig(
+        cache_embeddings=False,
+        embedding_provider=EmbeddingProvider.OPENAI,
+    )
+    pipeline = EmbeddingPipeline(config=config)
+
+    with patch.object(
+        pipeline, "_embed_openai", new_callable=AsyncMock
+    ) as mock_embed:
+        mock_embed.return_value = [[0.1], [0.2]]
+        result = await pipeline.embed_batch(
+            ["See parent", "unique", "See parent", "See parent"]
+        )
+
+    mock_embed.assert_called_once_with(["See parent", "unique"])
+    assert result == [[0.1], [0.2], [0.1], [0.1]]
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_runs_sub_batches_concurrently():
+    """Test that OpenAI sub-batches overlap and keep input order."""
+    config = VectorConfig(
+        cache_embeddings=False,
+        embedding_provider=EmbeddingProvider.OPENAI,
+        batch_size=2,
+        max_concurrent_embeddings=5,
+    )
+    pipeline = EmbeddingPipeline(config=config)
+    in_flight = 0
+    peak = 0
+
+    async def fake_embed(texts):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return [[float(t)] for t in texts]
+
+    with patch.object(pipeline, "_embed_openai", side_effect=fake_embed):
+        result = await pipeline.embed_batch([str(i) for i in range(6)])
+
+    assert result == [[float(i)] for i in range(6)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_embed_openai_waits_for_rate_limiter():
+    """Test that each API request takes a token from the rate limiter."""
+    config = VectorConfig(
+        cache_embeddings=False,
+        embedding_provider=EmbeddingProvider.OPENAI,
+        embedding_requests_per_minute=60,
+    )
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(
+        return_value=MagicMock(data=[MagicMock(index=0, embedding=[0.1])])
+    )
+    pipeline = EmbeddingPipeline(config=config, client=client)
+    assert pipeline.rate_limiter is not None
+
+    with patch.object(pipeline.rate_limiter, "acquire", new=AsyncMock()) as acquire:
+        assert await pipeline._embed_openai(["text"]) == [[0.1]]
+
+    acquire.assert_awaited_once()
+    assert EmbeddingPipeline(config=VectorConfig()).rate_limiter is None
+
+
 def test_local_model_task_prefix():
     """Test that nomic models get task prefix."""
     config = VectorConfig(
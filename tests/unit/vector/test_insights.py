@@ -0,0 +1,57 @@
+"""Tests for the vector insights module."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from mcp_atlassian.vector.insights import InsightsEngine
+
+
+def pairwise_groups(vectors: np.ndarray, min_similarity: float) -> list[list[int]]:
+    """Group rows the way find_bug_patterns did before it was vectorized."""
+    groups = []
+    used: set[int] = set()
+    for i in range(len(vectors)):
+        if i in used:
+            continue
+        similarities = 1 - np.linalg.norm(vectors - vectors[i], axis=1) / 2
+        indices = np.where(similarities >= min_similarity)[0]
+        if len(indices) > 1:
+            used.update(indices.tolist())
+            groups.append(indices.tolist())
+    return groups
+
+
+def test_find_bug_patterns_matches_pairwise_distances():
+    """Test that bug groups match the pairwise-distance formulation."""
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(3, 16))
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+    # Three tight clusters of different sizes plus unrelated singletons
+    vectors = np.vstack([
+        centers[0] + rng.normal(scale=0.02, size=(4, 16)),
+        centers[1] + rng.normal(scale=0.02, size=(2, 16)),
+        rng.normal(size=(3, 16)),
+        centers[2] + rng.normal(scale=0.02, size=(3, 16)),
+    ])
+    vectors = vectors[rng.permutation(len(vectors))].astype(np.float32)
+    issue_ids = [f"PROJ-{i}" for i in range(len(vectors))]
+    store = MagicMock()
+    store.issues_table.to_pandas.return_value = pd.DataFrame({
+        "issue_id": issue_ids,
+        "issue_type": ["Bug"] * len(vectors),
+        "project_key": ["PROJ"] * len(vectors),
+        "summary": ["Login fails"] * len(vectors),
+        "status": ["Open"] * len(vectors),
+        "vector": [v.tolist() for v in vectors],
+    })
+
+    patterns = InsightsEngine(store).find_bug_patterns(min_similarity=0.9)
+
+    expected = sorted(pairwise_groups(vectors, 0.9), key=len, reverse=True)
+    assert [len(group) for group in expected] == [4, 3, 2]
+    assert [p["bug_count"] for p in patterns] == [4, 3, 2]
+    assert [p["bugs"] for p in patterns] == [
+        [issue_ids[i] for i in group] for group in expected
+    ]
@@ -0,0 +1,40 @@
+"""Tests for the vector rate_limit module."""
+
+import time
+
+import pytest
+
+from mcp_atlassian.vector.config import VectorConfig
+from mcp_atlassian.vector.embeddings import EmbeddingPipeline
+from mcp_atlassian.vector.rate_limit import RateLimiter, get_rate_limiter
+
+
+def test_rejects_non_positive_rate():
+    """Test that a limiter needs a positive budget."""
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+@pytest.mark.asyncio
+async def test_allows_burst_then_paces():
+    """Test that a second's worth of requests pass, then requests wait."""
+    limiter = RateLimiter(requests_per_minute=600)  # 10 per second
+
+    start = time.monotonic()
+    for _ in range(10):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+    await limiter.acquire()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_pipelines_share_one_limiter_per_budget():
+    """Test that every pipeline with the same budget draws from one bucket."""
+    config = VectorConfig(embedding_requests_per_minute=120)
+    first = EmbeddingPipeline(config=config).rate_limiter
+    second = EmbeddingPipeline(config=config).rate_limiter
+
+    assert first is second is get_rate_limiter(120)
+    assert get_rate_limiter(60) is not first
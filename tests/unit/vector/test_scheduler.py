@@ -0,0 +1,29 @@
+"""Tests for the vector scheduler module."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.vector.config import VectorConfig
+from mcp_atlassian.vector.scheduler import SyncScheduler
+from mcp_atlassian.vector.sync import SyncResult
+
+
+@pytest.mark.asyncio
+async def test_run_once_reports_result_to_on_sync(tmp_path):
+    """Test that each completed sync is passed to the on_sync hook."""
+    on_sync = MagicMock()
+    scheduler = SyncScheduler(
+        MagicMock(),
+        config=VectorConfig(db_path=tmp_path / "lancedb"),
+        interval_minutes=30,
+        on_sync=on_sync,
+    )
+    result = SyncResult(issues_embedded=3)
+
+    with patch("mcp_atlassian.vector.scheduler.VectorSyncEngine") as engine_cls:
+        engine_cls.return_value.incremental_sync = AsyncMock(return_value=result)
+        assert await scheduler.run_once() is result
+
+    on_sync.assert_called_once_with(result)
+    assert scheduler.status["sync_count"] == 1
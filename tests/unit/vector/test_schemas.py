@@ -207,6 +207,17 @@ class TestPrepareIssueForEmbedding:
         result = prepare_issue_for_embedding(issue)
         assert "Test" in result
 
+    def test_uses_precleaned_description(self):
+        """Test that an already cleaned description is used as is."""
+        issue = {
+            "summary": "Test",
+            "description": "Raw *markup* text",
+            "description_clean": "Pre-cleaned text",
+        }
+        result = prepare_issue_for_embedding(issue)
+        assert "Description: Pre-cleaned text" in result
+        assert "markup" not in result
+
 
 class TestPrepareCommentForEmbedding:
     """Tests for prepare_comment_for_embedding function."""
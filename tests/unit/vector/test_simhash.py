@@ -0,0 +1,34 @@
+"""Tests for the vector simhash module."""
+
+from mcp_atlassian.vector.simhash import SimHashIndex, simhash
+
+TEXT = (
+    "Login fails with a 500 error when the session cookie expires while the "
+    "user is on the billing settings page and tries to update the card"
+)
+
+
+def test_simhash_is_stable_and_close_for_small_edits():
+    """Test that fingerprints are deterministic and near for typo fixes."""
+    assert simhash(TEXT) == simhash(TEXT)
+    assert simhash("") == 0
+
+    edited = TEXT.replace("tries", "trys")
+    distance = (simhash(TEXT) ^ simhash(edited)).bit_count()
+    unrelated = (simhash(TEXT) ^ simhash("Add dark mode to the dashboard")).bit_count()
+    assert distance < unrelated
+
+
+def test_index_finds_near_duplicates_only():
+    """Test that only nearly identical texts resolve to an indexed key."""
+    index = SimHashIndex()
+    index.add("key1", TEXT)
+    index.add("key1", TEXT)
+    assert len(index) == 1
+
+    assert index.find(TEXT) == "key1"
+    assert index.find(TEXT + " ") == "key1"
+    assert index.find("Add dark mode to the dashboard") is None
+
+    index.clear()
+    assert index.find(TEXT) is None
@@ -0,0 +1,74 @@
+"""Tests for the vector store module."""
+
+from datetime import datetime
+
+import pytest
+
+from mcp_atlassian.vector.config import VectorConfig
+from mcp_atlassian.vector.schemas import JiraIssueEmbedding
+from mcp_atlassian.vector.store import LanceDBStore
+
+
+def make_issue(
+    index: int,
+    assignee: str | None = None,
+    project_key: str = "PROJ",
+) -> JiraIssueEmbedding:
+    """Build an issue whose vector is the unit vector along ``index``."""
+    vector = [0.0] * 1536
+    vector[index] = 1.0
+    return JiraIssueEmbedding(
+        issue_id=f"{project_key}-{index}",
+        project_key=project_key,
+        vector=vector,
+        summary=f"Issue {index}",
+        issue_type="Bug",
+        status="Open",
+        status_category="To Do",
+        assignee=assignee,
+        reporter="Reporter",
+        created_at=datetime(2024, 1, 15),
+        updated_at=datetime(2024, 1, 15),
+        content_hash=f"hash-{index}",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store backed by a temporary LanceDB directory."""
+    return LanceDBStore(config=VectorConfig(db_path=tmp_path / "lancedb"))
+
+
+def test_search_issues_projects_columns(store):
+    """Test that a column projection still returns distances and scores."""
+    store.bulk_insert_issues([make_issue(i) for i in range(3)])
+    query = [0.0] * 1536
+    query[0] = 1.0
+
+    results, _ = store.search_issues(
+        query, limit=2, columns=["summary", "status", "_distance"]
+    )
+
+    assert results[0]["issue_id"] == "PROJ-0"
+    assert results[0]["_distance"] == pytest.approx(0.0)
+    assert results[0]["score"] == pytest.approx(1.0)
+    assert set(results[0]) == {"issue_id", "summary", "status", "_distance", "score"}
+
+
+def test_project_aggregations_rank_top_assignees(store):
+    """Test that top assignees are ordered, capped at ten and skip unassigned."""
+    issues = []
+    # Assignee "User 0" has 12 issues, "User 1" has 11, ... "User 11" has 1
+    for rank in range(12):
+        for _ in range(12 - rank):
+            issues.append(make_issue(len(issues), assignee=f"User {rank}"))
+    issues.extend(make_issue(len(issues)) for _ in range(20))
+    issues.append(make_issue(len(issues), assignee="Other", project_key="OPS"))
+    store.bulk_insert_issues(issues)
+
+    aggregations = store.get_project_aggregations("PROJ")
+
+    assert aggregations["total_issues"] == 98
+    assert list(aggregations["top_assignees"].items()) == [
+        (f"User {rank}", 12 - rank) for rank in range(10)
+    ]
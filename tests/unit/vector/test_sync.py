@@ -1,5 +1,6 @@
 """Tests for the vector sync module."""
 
+import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
@@ -7,7 +8,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from mcp_atlassian.models.jira import (
+    JiraIssue,
+    JiraIssueLink,
+    JiraIssueType,
+    JiraLinkedIssue,
+    JiraPriority,
+    JiraStatus,
+    JiraStatusCategory,
+    JiraUser,
+)
 from mcp_atlassian.vector.config import VectorConfig
+from mcp_atlassian.vector.schemas import compute_content_hash
 from mcp_atlassian.vector.sync import SyncResult, SyncState, VectorSyncEngine
 
 
@@ -39,6 +51,7 @@ class TestSyncState:
             total_comments_indexed=50,
         )
         state.save(state_path)
+        assert list(tmp_path.iterdir()) == [state_path]  # No temp file left behind
 
         # Load and verify
         loaded = SyncState.load(state_path)
@@ -188,6 +201,32 @@ class TestVectorSyncEngine:
             assert result.issues_processed == 20
             assert result.issues_embedded == 16
 
+    @pytest.mark.asyncio
+    async def test_full_sync_bounds_project_concurrency(self, mock_jira, config):
+        """Test that full sync overlaps projects up to the configured limit."""
+        config.max_concurrent_projects = 2
+        engine = VectorSyncEngine(mock_jira, config=config)
+        in_flight = 0
+        peak = 0
+
+        async def fake_sync(project_key, incremental, state):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if project_key == "BAD":
+                raise RuntimeError("boom")
+            return SyncResult(issues_processed=1, issues_embedded=1)
+
+        with patch.object(engine, "_sync_project", side_effect=fake_sync):
+            result = await engine.full_sync(projects=["A", "B", "BAD", "C", "D"])
+
+        assert peak == 2
+        assert result.issues_processed == 4
+        assert len(result.errors) == 1
+        assert "BAD" in result.errors[0]
+
     @pytest.mark.asyncio
     async def test_incremental_sync_no_prior_state(self, mock_jira, config):
         """Test incremental sync with no prior sync state."""
@@ -202,6 +241,31 @@ class TestVectorSyncEngine:
             # Should use config projects when no prior state
             mock_sync.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_incremental_sync_deletion_checks_all_projects(
+        self, mock_jira, config
+    ):
+        """A failing deletion check for one project doesn't drop the others."""
+        engine = VectorSyncEngine(mock_jira, config=config)
+
+        async def fake_detect(project_key):
+            if project_key == "ENG":
+                raise RuntimeError("boom")
+            return 2
+
+        with (
+            patch.object(engine, "_sync_project", new_callable=AsyncMock) as mock_sync,
+            patch.object(
+                engine, "_detect_and_remove_deleted_issues", side_effect=fake_detect
+            ) as mock_detect,
+        ):
+            mock_sync.return_value = SyncResult(issues_processed=1)
+
+            result = await engine.incremental_sync(projects=["PROJ", "ENG", "OPS"])
+
+        assert mock_detect.call_count == 3
+        assert result.issues_deleted == 4
+
     @pytest.mark.asyncio
     async def test_sync_project_builds_correct_jql(self, mock_jira, config):
         """Test that sync builds correct JQL for project."""
@@ -222,79 +286,193 @@ class TestVectorSyncEngine:
         assert 'updated >= "2022-01-01"' in jql
         assert "ORDER BY key DESC" in jql
 
+    @pytest.mark.asyncio
+    async def test_incremental_sync_skips_unchanged_issues(self, mock_jira, config):
+        """Test unchanged issues are skipped using one hash lookup per page."""
+        config.sync_comments = True
+        engine = VectorSyncEngine(mock_jira, config=config)
+
+        def make_issue(key, summary):
+            return JiraIssue(
+                key=key,
+                summary=summary,
+                status=JiraStatus(name="Open"),
+                updated="2024-01-15T12:00:00",
+            )
+
+        unchanged = make_issue("PROJ-1", "Same")
+        changed = make_issue("PROJ-2", "Edited")
+        mock_jira.search_issues.return_value = MagicMock(
+            issues=[unchanged, changed], max_results=50
+        )
+        unchanged_dict = engine._issue_to_dict(unchanged)
+        stored_hashes = {
+            "PROJ-1": compute_content_hash(
+                summary=unchanged_dict["summary"],
+                description=unchanged_dict["description"],
+                labels=unchanged_dict["labels"],
+                status=unchanged_dict["status"],
+            ),
+            "PROJ-2": "stale",
+        }
+
+        with (
+            patch.object(
+                engine.store, "get_content_hashes", return_value=stored_hashes
+            ) as mock_hashes,
+            patch.object(engine.store, "get_all_issue_ids", return_value=[]),
+            patch.object(
+                engine, "_embed_and_store", new=AsyncMock(return_value=1)
+            ) as mock_embed,
+            patch.object(
+                engine,
+                "_sync_comments_for_issues",
+                new=AsyncMock(return_value=(0, 0, [])),
+            ) as mock_comments,
+        ):
+            result = await engine._sync_project(
+                "PROJ", incremental=True, state=SyncState()
+            )
+
+        mock_hashes.assert_called_once_with(["PROJ-1", "PROJ-2"])
+        assert result.issues_skipped == 1
+        embedded = mock_embed.call_args.args[0]
+        assert [i["issue_id"] for i in embedded] == ["PROJ-2"]
+        mock_comments.assert_awaited_once_with(["PROJ-2"])
+
+    @pytest.mark.asyncio
+    async def test_sync_project_pages_past_server_cap(self, mock_jira, config):
+        """Test that a server capping page size below the request keeps paginating."""
+        config.jira_page_size = 500
+        engine = VectorSyncEngine(mock_jira, config=config)
+
+        def page(start, count):
+            keys = [f"PROJ-{i}" for i in range(start, start + count)]
+            return MagicMock(
+                issues=[MagicMock(key=key) for key in keys],
+                max_results=50,
+            )
+
+        mock_jira.search_issues.side_effect = [page(100, 50), page(50, 50), page(0, 20)]
+
+        def fake_issue_to_dict(issue):
+            return {
+                "issue_id": issue.key,
+                "summary": issue.key,
+                "status": "Open",
+                "updated_at": "2024-01-15T12:00:00",
+            }
+
+        with (
+            patch.object(engine, "_issue_to_dict", side_effect=fake_issue_to_dict),
+            patch.object(engine, "_embed_and_store", new_callable=AsyncMock) as store,
+            patch.object(engine.store, "clear_issues", return_value=0),
+            patch.object(engine.store, "compact"),
+        ):
+            store.side_effect = lambda issues, bulk_insert: len(issues)
+            result = await engine._sync_project(
+                "PROJ", incremental=False, state=SyncState()
+            )
+
+        assert mock_jira.search_issues.call_count == 3
+        calls = mock_jira.search_issues.call_args_list
+        assert calls[0][1]["limit"] == 500
+        assert calls[1][1]["limit"] == 50
+        assert "key < 'PROJ-149'" in calls[1][1]["jql"]
+        assert "key < 'PROJ-99'" in calls[2][1]["jql"]
+        assert result.issues_processed == 120
+
     def test_issue_to_dict(self, mock_jira, config):
         """Test converting JiraIssue to dictionary."""
         engine = VectorSyncEngine(mock_jira, config=config)
 
-        # Create mock issue with proper nested objects
-        mock_issue_type = MagicMock()
-        mock_issue_type.name = "Bug"
-
-        mock_status = MagicMock()
-        mock_status.name = "Open"
-
-        mock_priority = MagicMock()
-        mock_priority.name = "High"
-
-        mock_assignee = MagicMock()
-        mock_assignee.display_name = "John"
-
-        mock_reporter = MagicMock()
-        mock_reporter.display_name = "Jane"
-
-        mock_issue = MagicMock()
-        mock_issue.key = "PROJ-123"
-        mock_issue.summary = "Test issue"
-        mock_issue.description = "Test description"
-        mock_issue.issue_type = mock_issue_type
-        mock_issue.status = mock_status
-        mock_issue.priority = mock_priority
-        mock_issue.assignee = mock_assignee
-        mock_issue.reporter = mock_reporter
-        mock_issue.labels = ["critical"]
-        mock_issue.components = ["auth"]
-        mock_issue.created = "2024-01-15T10:00:00"
-        mock_issue.updated = "2024-01-15T12:00:00"
-        mock_issue.resolutiondate = None
-        mock_issue.parent = None
-        mock_issue.links = []
-
-        result = engine._issue_to_dict(mock_issue)
+        issue = JiraIssue(
+            key="PROJ-123",
+            summary="Test issue",
+            description="Test description",
+            issue_type=JiraIssueType(name="Bug"),
+            status=JiraStatus(
+                name="Code Review",
+                category=JiraStatusCategory(
+                    key="indeterminate", name="In Progress"
+                ),
+            ),
+            priority=JiraPriority(name="High"),
+            assignee=JiraUser(display_name="John"),
+            reporter=JiraUser(display_name="Jane"),
+            labels=["critical"],
+            components=["auth"],
+            created="2024-01-15T10:00:00",
+            updated="2024-01-15T12:00:00",
+            issuelinks=[
+                JiraIssueLink(inward_issue=JiraLinkedIssue(key="PROJ-7")),
+                JiraIssueLink(outward_issue=JiraLinkedIssue(key="OPS-9")),
+            ],
+        )
+
+        result = engine._issue_to_dict(issue)
 
         assert result["issue_id"] == "PROJ-123"
         assert result["project_key"] == "PROJ"
         assert result["summary"] == "Test issue"
         assert result["issue_type"] == "Bug"
-        assert result["status"] == "Open"
+        assert result["status"] == "Code Review"
+        assert result["status_category"] == "In Progress"
         assert result["priority"] == "High"
         assert result["assignee"] == "John"
         assert result["reporter"] == "Jane"
         assert result["labels"] == ["critical"]
+        assert result["description_clean"] == "Test description"
+        assert result["linked_issues"] == ["PROJ-7", "OPS-9"]
+
+    def test_issue_to_dict_prefers_jira_status_category(self, mock_jira, config):
+        """Test the reported status category wins over status-name keywords."""
+        engine = VectorSyncEngine(mock_jira, config=config)
+
+        def make_issue(status):
+            return JiraIssue(key="PROJ-125", summary="Test issue", status=status)
+
+        reported = make_issue(
+            JiraStatus(
+                name="Resolved - Pending QA",
+                category=JiraStatusCategory(key="indeterminate", name="In Progress"),
+            )
+        )
+        # Category names are localized; only the key is stable
+        localized = make_issue(
+            JiraStatus(
+                name="Erledigt",
+                category=JiraStatusCategory(key="done", name="Fertig"),
+            )
+        )
+        unreported = make_issue(JiraStatus(name="In Testing"))
+
+        assert engine._issue_to_dict(reported)["status_category"] == "In Progress"
+        assert engine._issue_to_dict(localized)["status_category"] == "Done"
+        assert engine._issue_to_dict(unreported)["status_category"] == "In Progress"
 
     def test_issue_to_dict_with_parent(self, mock_jira, config):
         """Test converting issue with parent."""
         engine = VectorSyncEngine(mock_jira, config=config)
 
-        mock_issue = MagicMock()
-        mock_issue.key = "PROJ-124"
-        mock_issue.summary = "Sub-task"
-        mock_issue.description = None
-        mock_issue.issue_type = MagicMock(name="Sub-task")
-        mock_issue.status = MagicMock(name="Open")
-        mock_issue.priority = None
-        mock_issue.assignee = None
-        mock_issue.reporter = MagicMock(display_name="Jane")
-        mock_issue.labels = []
-        mock_issue.components = []
-        mock_issue.created = "2024-01-15T10:00:00"
-        mock_issue.updated = "2024-01-15T12:00:00"
-        mock_issue.resolutiondate = None
-        mock_issue.parent = {"key": "PROJ-100"}
-        mock_issue.links = []
-
-        result = engine._issue_to_dict(mock_issue)
+        issue = JiraIssue(
+            key="PROJ-124",
+            summary="Sub-task",
+            issue_type=JiraIssueType(name="Sub-task"),
+            status=JiraStatus(name="Closed"),
+            reporter=JiraUser(display_name="Jane"),
+            created="2024-01-15T10:00:00",
+            updated="2024-01-15T12:00:00",
+            parent={"key": "PROJ-100"},
+        )
+
+        result = engine._issue_to_dict(issue)
 
         assert result["parent_key"] == "PROJ-100"
+        assert result["issue_type"] == "Sub-task"
+        assert result["status_category"] == "Done"
+        assert result["assignee"] is None
+        assert result["priority"] is None
 
     def test_get_sync_status(self, mock_jira, config):
         """Test getting sync status."""
@@ -312,3 +490,17 @@ class TestVectorSyncEngine:
             assert status["total_issues_indexed"] == 100
             assert status["total_comments_indexed"] == 50
             assert str(config.db_path) in status["db_path"]
+
+    def test_get_sync_status_reuses_store_stats(self, mock_jira, config):
+        """Test store stats are cached until sync state is saved."""
+        engine = VectorSyncEngine(mock_jira, config=config)
+        stats = {"total_issues": 100, "total_comments": 50, "projects": ["PROJ"]}
+
+        with patch.object(engine.store, "get_stats", return_value=stats) as mock_stats:
+            engine.get_sync_status()
+            engine.get_sync_status()
+            assert mock_stats.call_count == 1
+
+            engine._save_state(SyncState())
+            engine.get_sync_status()
+            assert mock_stats.call_count == 2
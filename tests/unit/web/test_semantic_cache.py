@@ -0,0 +1,79 @@
+"""Tests for the web semantic_cache module."""
+
+import math
+import warnings
+
+import pytest
+
+from mcp_atlassian.web.semantic_cache import SemanticAnswerCache
+
+
+def at_similarity(similarity: float) -> list[float]:
+    """Build a unit vector with the given cosine similarity to [1, 0, 0]."""
+    return [similarity, math.sqrt(1 - similarity**2), 0.0]
+
+
+def test_hit_above_threshold_and_miss_below():
+    """Test that only queries at or above the threshold are served."""
+    cache = SemanticAnswerCache(threshold=0.95)
+    cache.store([1.0, 0.0, 0.0], "query", "answer", ["source"])
+
+    hit = cache.lookup(at_similarity(0.951))
+    assert hit is not None
+    assert hit.answer == "answer"
+    assert hit.sources == ["source"]
+    assert hit.score == pytest.approx(0.951, abs=1e-4)
+
+    assert cache.lookup(at_similarity(0.949)) is None
+
+
+def test_expire_drops_entries_older_than_ttl():
+    """Test that _expire trims only entries past their TTL."""
+    cache = SemanticAnswerCache(ttl_seconds=60)
+    cache.store([1.0, 0.0, 0.0], "old", "old answer", [])
+    cache.store([0.0, 1.0, 0.0], "new", "new answer", [])
+    cache._entries[0].created_at -= 61
+
+    cache._expire()
+
+    assert len(cache) == 1
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+    assert cache.lookup([0.0, 1.0, 0.0]).answer == "new answer"
+
+
+def test_evicts_oldest_beyond_max_entries():
+    """Test that storing past max_entries evicts the oldest answer."""
+    cache = SemanticAnswerCache(max_entries=2)
+    cache.store([1.0, 0.0, 0.0], "first", "first answer", [])
+    cache.store([0.0, 1.0, 0.0], "second", "second answer", [])
+    cache.store([0.0, 0.0, 1.0], "third", "third answer", [])
+
+    assert len(cache) == 2
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+    assert cache.lookup([0.0, 1.0, 0.0]).answer == "second answer"
+    assert cache.lookup([0.0, 0.0, 1.0]).answer == "third answer"
+
+
+def test_clears_when_embedding_dimension_changes():
+    """Test that vectors from a different model replace the old entries."""
+    cache = SemanticAnswerCache()
+    cache.store([1.0, 0.0, 0.0], "old", "old answer", [])
+    cache.store([1.0, 0.0, 0.0, 0.0], "new", "new answer", [])
+
+    assert len(cache) == 1
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+    assert cache.lookup([1.0, 0.0, 0.0, 0.0]).answer == "new answer"
+
+
+@pytest.mark.parametrize("scale", [0.0, 1e-45, 1e-30, 1e-20, 1e-13])
+def test_zero_and_tiny_vectors_are_ignored(scale):
+    """Test that vectors without a usable direction never match or store."""
+    cache = SemanticAnswerCache()
+    cache.store([1.0, 0.0, 0.0], "query", "answer", [])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert cache.lookup([scale, 0.0, 0.0]) is None
+        cache.store([scale, 0.0, 0.0], "tiny", "tiny answer", [])
+
+    assert len(cache) == 1
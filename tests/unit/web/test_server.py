@@ -0,0 +1,172 @@
+"""Tests for the web server module."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_atlassian.vector.config import EmbeddingProvider, VectorConfig
+from mcp_atlassian.vector.embeddings import EmbeddingPipeline
+from mcp_atlassian.web import server
+from mcp_atlassian.web.server import SearchRequest, SearchResponse
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Install an OpenAI-backed pipeline with a temporary cache."""
+    config = VectorConfig(
+        db_path=tmp_path / "lancedb",
+        embedding_provider=EmbeddingProvider.OPENAI,
+        embedding_dimensions=3,
+    )
+    pipeline = EmbeddingPipeline(config=config, client=MagicMock())
+    monkeypatch.setattr(server, "_pipeline", pipeline)
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_embed_once(pipeline):
+    """Test that simultaneous requests for one query share a provider call."""
+
+    async def fake_embed(texts):
+        await asyncio.sleep(0.01)
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+    with patch.object(pipeline, "_embed_openai", side_effect=fake_embed) as mock:
+        vectors = await asyncio.gather(
+            *(server.embed_query("login fails") for _ in range(5))
+        )
+
+    assert mock.await_count == 1
+    assert all(v == pytest.approx([0.1, 0.2, 0.3]) for v in vectors)
+    assert server._embed_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_pipeline():
+    """Test that in-flight searches are shared and survive a cancelled caller."""
+    calls = 0
+    release = asyncio.Event()
+    response = SearchResponse(answer="answer", sources=[])
+
+    async def fake_run_search(query):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return response
+
+    with patch.object(server, "_run_search", side_effect=fake_run_search):
+        request = SearchRequest(query=" login fails ")
+        waiters = [asyncio.create_task(server.search(request)) for _ in range(4)]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert calls == 1
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == [response] * 3
+    assert server._inflight_searches == {}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Install a mock store whose stats count up on every call."""
+    store = MagicMock()
+    store.get_stats.side_effect = [{"total_issues": n} for n in range(1, 10)]
+    monkeypatch.setattr(server, "_store", store)
+    monkeypatch.setattr(server, "_stats_cache", None)
+    monkeypatch.setattr(server, "_stats_refresh", None)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_store_stats_serves_stale_snapshot_and_refreshes_once(store):
+    """Test that a stale snapshot is served while one refresh runs behind it."""
+    assert (await server.store_stats())["total_issues"] == 1
+
+    fetched_at, stats = server._stats_cache
+    server._stats_cache = (fetched_at - server._STATS_TTL_SECONDS, stats)
+    results = await asyncio.gather(*(server.store_stats() for _ in range(3)))
+    assert [r["total_issues"] for r in results] == [1, 1, 1]
+
+    await server._stats_refresh
+    await asyncio.sleep(0)
+    assert store.get_stats.call_count == 2
+    assert server._stats_refresh is None
+    assert (await server.store_stats())["total_issues"] == 2
+
+
+@pytest.mark.asyncio
+async def test_store_stats_refreshes_inline_after_idle(store):
+    """Test that a snapshot past the staleness bound is never served."""
+    await server.store_stats()
+
+    fetched_at, stats = server._stats_cache
+    server._stats_cache = (fetched_at - server._STATS_MAX_STALE_SECONDS, stats)
+
+    assert (await server.store_stats())["total_issues"] == 2
+    assert server._stats_refresh is None
+
+
+def test_search_stream_emits_sources_deltas_then_done(pipeline, monkeypatch):
+    """Test the stream's frame order and its [DONE] terminator."""
+    store = MagicMock()
+    store.search_issues.return_value = (
+        [{"issue_id": "PROJ-1", "summary": "Login fails", "score": 0.9}],
+        1,
+    )
+    monkeypatch.setattr(server, "_store", store)
+    monkeypatch.setattr(server, "_answer_cache", server.SemanticAnswerCache())
+
+    async def tokens():
+        for text in ("Login ", "is broken."):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+            )
+
+    openai = MagicMock()
+    openai.chat.completions.create = AsyncMock(return_value=tokens())
+    monkeypatch.setattr(server, "_openai", openai)
+
+    with patch.object(
+        pipeline, "_embed_openai", new=AsyncMock(return_value=[[0.1, 0.2, 0.3]])
+    ):
+        response = TestClient(server.app).post(
+            "/api/search/stream", json={"query": "login fails"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = [f.removeprefix("data: ") for f in response.text.split("\n\n") if f]
+    assert frames[-1] == "[DONE]"
+    events = [orjson.loads(f) for f in frames[:-1]]
+    assert [s["issue_id"] for s in events[0]["sources"]] == ["PROJ-1"]
+    assert [e["delta"] for e in events[1:]] == ["Login ", "is broken."]
+    assert len(server._answer_cache) == 1
+    assert server._inflight_retrievals == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retrievals_share_one_search(pipeline, monkeypatch):
+    """Test that both search endpoints join an identical retrieval in flight."""
+    store = MagicMock()
+    store.search_issues.return_value = ([], 0)
+    monkeypatch.setattr(server, "_store", store)
+    monkeypatch.setattr(server, "_answer_cache", server.SemanticAnswerCache())
+
+    async def fake_embed(texts):
+        await asyncio.sleep(0.01)
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+    with patch.object(pipeline, "_embed_openai", side_effect=fake_embed):
+        results = await asyncio.gather(
+            *(server._retrieve("login fails") for _ in range(3))
+        )
+
+    assert store.search_issues.call_count == 1
+    assert all(r is results[0] for r in results)
+    assert server._inflight_retrievals == {}
@@ -13,11 +13,16 @@ export async function POST(request: Request) {
       )
     }
 
-    // Call the FastAPI backend
-    const response = await fetch(`${BACKEND_URL}/api/search`, {
+    // Stream from the FastAPI backend so sources and answer tokens reach the
+    // client as they are produced instead of after the full answer
+    const response = await fetch(`${BACKEND_URL}/api/search/stream`, {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
+      headers: {
+        "Content-Type": "application/json",
+        Accept: "text/event-stream",
+      },
       body: JSON.stringify({ query }),
+      signal: request.signal,
     })
 
     if (!response.ok) {
@@ -29,8 +34,15 @@ export async function POST(request: Request) {
       )
     }
 
-    const data = await response.json()
-    return NextResponse.json(data)
+    // Relay the Server-Sent Events frames as-is: a `sources` frame, `delta`
+    // frames with answer tokens, then `[DONE]`
+    return new Response(response.body, {
+      headers: {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache, no-transform",
+        Connection: "keep-alive",
+      },
+    })
   } catch (error) {
     console.error("Search error:", error)
     return NextResponse.json(